@@ -1,6 +1,9 @@
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from bson import ObjectId
+import asyncio
 from typing import Union
-from datetime import datetime
+from datetime import datetime, timezone
 import sys
 from pathlib import Path
 
@@ -10,17 +13,21 @@ if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
 from auth.router import get_current_user
-from database import db, get_next_sequence
+from database import db
 from logger import get_logger
 from ai_detection.service import (
     analyze_image_sightengine,
     analyze_video_sightengine,
+    average_frame_score,
     get_confidence_level,
+    SightengineBusyError,
+    SIGHTENGINE_ACQUIRE_TIMEOUT,
 )
 from ai_detection.schema import AIDetectionResponse, AIDetectionStats
 
 logger = get_logger(__name__)
-router = APIRouter()
+# orjson keeps serialization of the (large) raw Sightengine payload cheap
+router = APIRouter(default_response_class=ORJSONResponse)
 
 @router.post("/analyze-image", response_model=AIDetectionResponse)
 async def analyze_image(
@@ -28,14 +35,20 @@ async def analyze_image(
     current_user: dict = Depends(get_current_user),
 ):
     """Analyze image for AI-generated content."""
-    user_id = current_user.get("user_id") or str(current_user["_id"])
+    user_id = str(current_user.get("user_id") or current_user["_id"])
     logger.info(f"Image analysis requested by user {user_id}, filename={file.filename}")
     
-    file_bytes = await file.read()
-    logger.info(f"Image size: {len(file_bytes)} bytes")
+    logger.info(f"Image size: {file.size} bytes")
     
-    # Analyze with Sightengine
-    result = await analyze_image_sightengine(file_bytes)
+    # Analyze with Sightengine (streams the spooled upload instead of reading it into memory)
+    try:
+        result = await analyze_image_sightengine(file.file)
+    except SightengineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(int(SIGHTENGINE_ACQUIRE_TIMEOUT))},
+        )
     
     if "error" in result:
         raise HTTPException(status_code=500, detail=result["error"])
@@ -46,23 +59,37 @@ async def analyze_image(
     confidence_level = get_confidence_level(ai_score)
     
     # Save to MongoDB
-    detection_seq = await get_next_sequence("ai_detections")
-    detection_id = str(detection_seq)
-    now = datetime.utcnow()
+    # Client-generated ObjectId avoids a counter round-trip per detection
+    detection_oid = ObjectId()
+    detection_id = str(detection_oid)
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
     
     detection_doc = {
+        "_id": detection_oid,
         "detectionId": detection_id,
         "userId": user_id,
         "fileType": "image",
         "aiScore": ai_score,
         "isAiGenerated": is_ai_generated,
         "confidenceLevel": confidence_level,
-        "sightengineResult": result,
         "createdAt": now,
         "updatedAt": now,
     }
+    # Raw Sightengine payload lives in a sibling collection so the hot
+    # ai_detections documents stay compact
+    raw_doc = {
+        "_id": detection_oid,
+        "detectionId": detection_id,
+        "userId": user_id,
+        "sightengineResult": result,
+        "createdAt": now,
+    }
     
-    await db.ai_detections.insert_one(detection_doc)
+    await asyncio.gather(
+        db.ai_detections.insert_one(detection_doc),
+        db.ai_detections_raw.insert_one(raw_doc),
+    )
     logger.info(f"Saved detection {detection_id} for user {user_id}")
     
     return AIDetectionResponse(
@@ -71,7 +98,7 @@ async def analyze_image(
         is_ai_generated=is_ai_generated,
         confidence_level=confidence_level,
         sightengine_result=result,
-        timestamp=now,
+        timestamp=now_iso,
     )
 
 @router.post("/analyze-video", response_model=AIDetectionResponse)
@@ -80,14 +107,20 @@ async def analyze_video(
     current_user: dict = Depends(get_current_user),
 ):
     """Analyze video for AI-generated content."""
-    user_id = current_user.get("user_id") or str(current_user["_id"])
+    user_id = str(current_user.get("user_id") or current_user["_id"])
     logger.info(f"Video analysis requested by user {user_id}, filename={file.filename}")
     
-    file_bytes = await file.read()
-    logger.info(f"Video size: {len(file_bytes)} bytes")
+    logger.info(f"Video size: {file.size} bytes")
     
-    # Analyze with Sightengine
-    result = await analyze_video_sightengine(file_bytes)
+    # Analyze with Sightengine (streams the spooled upload instead of reading it into memory)
+    try:
+        result = await analyze_video_sightengine(file.file)
+    except SightengineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(int(SIGHTENGINE_ACQUIRE_TIMEOUT))},
+        )
     
     if "error" in result:
         raise HTTPException(status_code=500, detail=result["error"])
@@ -97,15 +130,7 @@ async def analyze_video(
     frames = result.get("data", {}).get("frames", [])
     if frames:
         # Calculate average AI score from all frames
-        frame_scores = [
-            frame.get("type", {}).get("ai_generated", 0.0)
-            for frame in frames
-            if frame.get("type", {}).get("ai_generated") is not None
-        ]
-        if frame_scores:
-            ai_score = sum(frame_scores) / len(frame_scores)
-        else:
-            ai_score = 0.0
+        ai_score = average_frame_score(frames)
     else:
         # Fallback to direct type path
         ai_score = result.get("type", {}).get("ai_generated", 0.0)
@@ -114,23 +139,37 @@ async def analyze_video(
     confidence_level = get_confidence_level(ai_score)
     
     # Save to MongoDB
-    detection_seq = await get_next_sequence("ai_detections")
-    detection_id = str(detection_seq)
-    now = datetime.utcnow()
+    # Client-generated ObjectId avoids a counter round-trip per detection
+    detection_oid = ObjectId()
+    detection_id = str(detection_oid)
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
     
     detection_doc = {
+        "_id": detection_oid,
         "detectionId": detection_id,
         "userId": user_id,
         "fileType": "video",
         "aiScore": ai_score,
         "isAiGenerated": is_ai_generated,
         "confidenceLevel": confidence_level,
-        "sightengineResult": result,
         "createdAt": now,
         "updatedAt": now,
     }
+    # Raw Sightengine payload lives in a sibling collection so the hot
+    # ai_detections documents stay compact
+    raw_doc = {
+        "_id": detection_oid,
+        "detectionId": detection_id,
+        "userId": user_id,
+        "sightengineResult": result,
+        "createdAt": now,
+    }
     
-    await db.ai_detections.insert_one(detection_doc)
+    await asyncio.gather(
+        db.ai_detections.insert_one(detection_doc),
+        db.ai_detections_raw.insert_one(raw_doc),
+    )
     logger.info(f"Saved detection {detection_id} for user {user_id}")
     
     return AIDetectionResponse(
@@ -139,29 +178,59 @@ async def analyze_video(
         is_ai_generated=is_ai_generated,
         confidence_level=confidence_level,
         sightengine_result=result,
-        timestamp=now,
+        timestamp=now_iso,
     )
 
-@router.get("/stats", response_model=AIDetectionStats)
-async def get_detection_stats(
+@router.get("/detections/{detection_id}/raw")
+async def get_detection_raw(
+    detection_id: str,
     current_user: dict = Depends(get_current_user),
 ):
-    """Get AI detection statistics for current user."""
-    user_id = current_user.get("user_id") or str(current_user["_id"])
+    """Get the raw Sightengine result stored for one of the current user's detections."""
+    user_id = str(current_user.get("user_id") or current_user["_id"])
     
-    query = {
-        "$or": [
-            {"userId": user_id},
-            {"userId": {"$in": [int(user_id), str(user_id)]}},
-        ]
-    }
+    if not ObjectId.is_valid(detection_id):
+        raise HTTPException(status_code=404, detail="Detection not found")
     
-    detections = await db.ai_detections.find(query).to_list(length=None)
+    raw_doc = await db.ai_detections_raw.find_one(
+        {"_id": ObjectId(detection_id), "userId": user_id},
+        {"_id": 0, "sightengineResult": 1},
+    )
+    if raw_doc is None:
+        raise HTTPException(status_code=404, detail="Detection not found")
     
-    total = len(detections)
-    ai_generated = sum(1 for d in detections if d.get("isAiGenerated", False))
+    return raw_doc["sightengineResult"]
+
+@router.get("/stats", response_model=AIDetectionStats)
+async def get_detection_stats(
+    current_user: dict = Depends(get_current_user),
+):
+    """Get AI detection statistics for current user."""
+    user_id = str(current_user.get("user_id") or current_user["_id"])
+    
+    # userId is stored as a string (see ensure_indexes backfill), so this is an indexed equality match
+    query = {"userId": user_id}
+    
+    # Aggregate server-side so only one summary document crosses the wire
+    pipeline = [
+        {"$match": query},
+        {"$project": {"_id": 0, "isAiGenerated": 1, "aiScore": 1}},
+        {
+            "$group": {
+                "_id": None,
+                "total": {"$sum": 1},
+                "ai_generated": {"$sum": {"$cond": [{"$eq": ["$isAiGenerated", True]}, 1, 0]}},
+                "avg_score": {"$avg": {"$ifNull": ["$aiScore", 0.0]}},
+            }
+        },
+    ]
+    # Pin the (userId, createdAt) index created by ensure_indexes
+    summary = await db.ai_detections.aggregate(pipeline, hint="userId_1_createdAt_-1").to_list(length=1)
+    
+    total = summary[0]["total"] if summary else 0
+    ai_generated = summary[0]["ai_generated"] if summary else 0
     human_generated = total - ai_generated
-    avg_score = sum(d.get("aiScore", 0.0) for d in detections) / total if total > 0 else 0.0
+    avg_score = (summary[0]["avg_score"] or 0.0) if summary else 0.0
     
     return AIDetectionStats(
         total_detections=total,
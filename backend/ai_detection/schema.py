@@ -8,7 +8,7 @@ class AIDetectionResponse(BaseModel):
     is_ai_generated: bool
     confidence_level: str
     sightengine_result: dict
-    timestamp: datetime
+    timestamp: str  # ISO-8601, formatted once per request
 
 class AIDetectionStats(BaseModel):
     total_detections: int
@@ -1,6 +1,10 @@
+import asyncio
 import httpx
+import numpy as np
+import orjson
 import os
-from typing import Dict, Any
+from contextlib import asynccontextmanager
+from typing import Dict, Any, BinaryIO, List, Union
 from pathlib import Path
 import sys
 
@@ -14,8 +18,43 @@ from config import SIGHTENGINE_API_USER, SIGHTENGINE_API_SECRET
 
 logger = get_logger(__name__)
 
-async def analyze_image_sightengine(file_bytes: bytes) -> Dict[str, Any]:
-    """Analyze image using Sightengine API."""
+# Shared client so connections to api.sightengine.com are kept alive across requests
+_CLIENT = httpx.AsyncClient(
+    timeout=httpx.Timeout(600.0),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+
+# Bound concurrent uploads so bursts can't exhaust memory or the upstream quota
+SIGHTENGINE_CONCURRENCY = int(os.getenv("SIGHTENGINE_CONCURRENCY", "8"))
+SIGHTENGINE_ACQUIRE_TIMEOUT = float(os.getenv("SIGHTENGINE_ACQUIRE_TIMEOUT", "30"))
+_SIGHTENGINE_SEM = asyncio.Semaphore(SIGHTENGINE_CONCURRENCY)
+
+class SightengineBusyError(Exception):
+    """Raised when no Sightengine upload slot frees up within the acquire timeout."""
+
+@asynccontextmanager
+async def _sightengine_slot():
+    """Hold one of the bounded Sightengine upload slots for the duration of a call."""
+    try:
+        await asyncio.wait_for(_SIGHTENGINE_SEM.acquire(), timeout=SIGHTENGINE_ACQUIRE_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Sightengine concurrency limit reached, rejecting upload")
+        raise SightengineBusyError("Too many concurrent analyses, please retry shortly")
+    try:
+        yield
+    finally:
+        _SIGHTENGINE_SEM.release()
+
+async def close_sightengine_client() -> None:
+    """Close the shared Sightengine HTTP client (called on app shutdown)."""
+    await _CLIENT.aclose()
+
+async def analyze_image_sightengine(media: Union[bytes, BinaryIO]) -> Dict[str, Any]:
+    """Analyze image using Sightengine API.
+
+    ``media`` may be raw bytes or a file-like object; file objects are streamed
+    to Sightengine in chunks instead of being loaded into memory first.
+    """
     url = "https://api.sightengine.com/1.0/check.json"
     
     data = {
@@ -24,19 +63,19 @@ async def analyze_image_sightengine(file_bytes: bytes) -> Dict[str, Any]:
         "api_secret": SIGHTENGINE_API_SECRET,
     }
     
-    files = {"media": ("upload", file_bytes)}
+    files = {"media": ("upload", media, "application/octet-stream")}
     
-    try:
-        async with httpx.AsyncClient(timeout=180.0) as client:
-            response = await client.post(url, data=data, files=files)
+    async with _sightengine_slot():
+        try:
+            response = await _CLIENT.post(url, data=data, files=files, timeout=180.0)
             response.raise_for_status()
-            return response.json()
-    except Exception as e:
-        logger.error(f"Sightengine image analysis error: {e}")
-        return {"error": str(e)}
+            return orjson.loads(response.content)
+        except Exception as e:
+            logger.error(f"Sightengine image analysis error: {e}")
+            return {"error": str(e)}
 
-async def analyze_video_sightengine(file_bytes: bytes) -> Dict[str, Any]:
-    """Analyze video using Sightengine API."""
+async def analyze_video_sightengine(media: Union[bytes, BinaryIO]) -> Dict[str, Any]:
+    """Analyze video using Sightengine API (``media`` as bytes or file-like object)."""
     url = "https://api.sightengine.com/1.0/video/check-sync.json"
     
     data = {
@@ -45,23 +84,46 @@ async def analyze_video_sightengine(file_bytes: bytes) -> Dict[str, Any]:
         "api_secret": SIGHTENGINE_API_SECRET,
     }
     
-    files = {"media": ("video.mp4", file_bytes)}
+    files = {"media": ("video.mp4", media, "video/mp4")}
     
-    try:
-        async with httpx.AsyncClient(timeout=600.0) as client:
-            response = await client.post(url, data=data, files=files)
+    async with _sightengine_slot():
+        try:
+            response = await _CLIENT.post(url, data=data, files=files, timeout=600.0)
             response.raise_for_status()
-            return response.json()
-    except Exception as e:
-        logger.error(f"Sightengine video analysis error: {e}")
-        return {"error": str(e)}
+            return orjson.loads(response.content)
+        except Exception as e:
+            logger.error(f"Sightengine video analysis error: {e}")
+            return {"error": str(e)}
+
+# Confidence levels indexed by how many thresholds the score exceeds
+_CONFIDENCE_LEVELS = ("Low", "Medium", "High")
+_CONFIDENCE_THRESHOLDS = (0.40, 0.75)
 
 def get_confidence_level(ai_score: float) -> str:
     """Determine confidence level based on AI score."""
-    if ai_score > 0.75:
-        return "High"
-    elif ai_score > 0.40:
-        return "Medium"
-    else:
-        return "Low"
+    return _CONFIDENCE_LEVELS[(ai_score > _CONFIDENCE_THRESHOLDS[0]) + (ai_score > _CONFIDENCE_THRESHOLDS[1])]
+
+# Below this many frames a plain Python loop beats NumPy's setup cost
+_NUMPY_MIN_FRAMES = 32
 
+def average_frame_score(frames: List[Dict[str, Any]]) -> float:
+    """Average ``type.ai_generated`` over the frames that report it (0.0 if none do)."""
+    if len(frames) < _NUMPY_MIN_FRAMES:
+        total = 0.0
+        scored = 0
+        for frame in frames:
+            frame_score = frame.get("type", {}).get("ai_generated")
+            if frame_score is not None:
+                total += frame_score
+                scored += 1
+        return total / scored if scored else 0.0
+    
+    scores = np.fromiter(
+        (
+            frame_score
+            for frame_score in (frame.get("type", {}).get("ai_generated") for frame in frames)
+            if frame_score is not None
+        ),
+        dtype=np.float64,
+    )
+    return float(scores.mean()) if scores.size else 0.0
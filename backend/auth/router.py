@@ -1,10 +1,12 @@
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
+from pymongo.errors import DuplicateKeyError
 
 from database import db, get_next_sequence
 from auth.schemas import UserCreate, Token, UserResponse, GoogleAuthCallback
-from auth.security import get_password_hash, verify_password, create_access_token
+from auth.security import hash_password_async, verify_password_async, create_access_token
 from config import SECRET_KEY, ALGORITHM
 from logger import get_logger
 
@@ -15,6 +17,16 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
 # Dependency setup for protecting routes
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# Resolved users keyed by email, so chatty clients skip the Mongo lookup on every
+# request; entries are evicted wherever a user document is updated
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def invalidate_cached_user(email: str) -> None:
+    """Drop a user from the auth cache after their document changes."""
+    _user_cache.pop(email, None)
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -31,21 +43,23 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         logger.warning(f"Token validation failed: {e}")
         raise credentials_exception
     
+    cached_user = _user_cache.get(email)
+    if cached_user is not None:
+        # Callers get their own copy so one request can't alter another's view of the user
+        return dict(cached_user)
+    
     user = await db["users"].find_one({"email": email})
     if user is None:
         logger.warning(f"Token validation failed: User not found - {email}")
         raise credentials_exception
-    return user
+    _user_cache[email] = user
+    return dict(user)
 
 # --- ROUTES ---
 
 @router.post("/signup", response_model=Token)
 async def signup(user: UserCreate):
     logger.info(f"Signup attempt for email: {user.email}")
-    # Check if user already exists
-    if await db["users"].find_one({"email": user.email}):
-        logger.warning(f"Signup failed: Email already registered - {user.email}")
-        raise HTTPException(status_code=400, detail="Email already registered")
     
     # Validate password length
     if len(user.password) > 72:
@@ -55,11 +69,17 @@ async def signup(user: UserCreate):
             detail="Password is too long (maximum 72 characters)"
         )
     
+    # Cheap indexed check so duplicates don't pay for a bcrypt hash or burn a user_id;
+    # the unique index still decides races between concurrent signups
+    if await db["users"].find_one({"email": user.email}, projection={"_id": 1}):
+        logger.warning(f"Signup failed: Email already registered - {user.email}")
+        raise HTTPException(status_code=400, detail="Email already registered")
+    
     # Hash password and save
     try:
         user_dict = user.model_dump()
         user_dict["user_id"] = await get_next_sequence("users")
-        user_dict["hashed_password"] = get_password_hash(user.password)
+        user_dict["hashed_password"] = await hash_password_async(user.password)
         del user_dict["password"]
         
         await db["users"].insert_one(user_dict)
@@ -68,6 +88,9 @@ async def signup(user: UserCreate):
         # Auto-login (Generate Token)
         access_token = create_access_token(data={"sub": user.email})
         return {"access_token": access_token, "token_type": "bearer"}
+    except DuplicateKeyError:
+        logger.warning(f"Signup failed: Email already registered - {user.email}")
+        raise HTTPException(status_code=400, detail="Email already registered")
     except ValueError as e:
         logger.error(f"Signup error for {user.email}: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -78,7 +101,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     # OAuth2PasswordRequestForm expects 'username' and 'password'
     user = await db["users"].find_one({"email": form_data.username})
     
-    if not user or not verify_password(form_data.password, user["hashed_password"]):
+    if not user or not await verify_password_async(form_data.password, user["hashed_password"]):
         logger.warning(f"Login failed: Invalid credentials for email - {form_data.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -121,6 +144,7 @@ async def google_auth_callback(auth_data: GoogleAuthCallback):
                     }
                 }
             )
+            invalidate_cached_user(auth_data.email)
     else:
         # New user - create account
         logger.info(f"Creating new user via Google OAuth: {auth_data.email}")
@@ -133,8 +157,12 @@ async def google_auth_callback(auth_data: GoogleAuthCallback):
             # No hashed_password for OAuth users
         }
         
-        await db["users"].insert_one(user_dict)
-        logger.info(f"User successfully created via Google OAuth: {auth_data.email} (user_id: {user_dict['user_id']})")
+        try:
+            await db["users"].insert_one(user_dict)
+            logger.info(f"User successfully created via Google OAuth: {auth_data.email} (user_id: {user_dict['user_id']})")
+        except DuplicateKeyError:
+            # A concurrent callback created the account first; just log them in
+            logger.info(f"User already created by concurrent Google OAuth callback: {auth_data.email}")
     
     # Generate JWT token
     access_token = create_access_token(data={"sub": auth_data.email})
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from jose import jwt
 import bcrypt
@@ -6,6 +7,9 @@ from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Cap concurrent bcrypt work so a burst of logins can't saturate every core
+_BCRYPT_SEM = asyncio.Semaphore(4)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a bcrypt hash."""
     return bcrypt.checkpw(
@@ -25,6 +29,16 @@ def get_password_hash(password: str) -> str:
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password off the event loop."""
+    async with _BCRYPT_SEM:
+        return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password off the event loop."""
+    async with _BCRYPT_SEM:
+        return await asyncio.to_thread(get_password_hash, password)
+
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(days=365)
@@ -1,8 +1,10 @@
+import hashlib
 import re
-import json
+import orjson
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import sys
+from cachetools import TTLCache
 
 # Add backend root to path
 BACKEND_ROOT = Path(__file__).resolve().parent.parent
@@ -10,30 +12,15 @@ if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
 from logger import get_logger
-import importlib.util
-
-# Import from misinformation-agent config
-MISINFO_DIR = Path(__file__).resolve().parent.parent / "misinformation-agent"
-misinfo_config_path = MISINFO_DIR / "config.py"
-spec = importlib.util.spec_from_file_location("misinfo_config", misinfo_config_path)
-if spec and spec.loader:
-    misinfo_config = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(misinfo_config)
-    GEMINI_API_KEY = misinfo_config.APP_CONFIG.get("GOOGLE_CLOUD_API_KEY", "")
-    LLM_MODEL_NAME = misinfo_config.APP_CONFIG.get("LLM_MODEL_NAME", "gemini-2.0-flash-exp")
-else:
-    GEMINI_API_KEY = ""
-    LLM_MODEL_NAME = "gemini-2.0-flash-exp"
-
-# Import LLMClient from agentic_pipeline
-MISINFO_DIR_STR = str(MISINFO_DIR)
-if MISINFO_DIR_STR not in sys.path:
-    sys.path.insert(0, MISINFO_DIR_STR)
+from chatbot.tools._config import GEMINI_API_KEY, LLM_MODEL_NAME
 
 from agentic_pipeline import LLMClient
 
 logger = get_logger(__name__)
 
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
 INTENT_PROMPT = """
 Analyze the user's query and classify the intent. The user may:
 1. Ask to verify/check a claim (misinformation detection)
@@ -57,35 +44,91 @@ Return JSON ONLY with this format:
 Query: "{query}"
 """
 
+# LLM classifications keyed by SHA-1 of (normalized message, has_media)
+_INTENT_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+
+# Shared across all classifiers; built on first use so importing this module stays cheap
+_LLM_CLIENT: Optional[LLMClient] = None
+
+def _get_llm_client() -> LLMClient:
+    """Return the shared LLM client, creating it on first call."""
+    global _LLM_CLIENT
+    # Construction is synchronous, so no await can interleave between check and set
+    if _LLM_CLIENT is None:
+        _LLM_CLIENT = LLMClient(GEMINI_API_KEY, LLM_MODEL_NAME)
+    return _LLM_CLIENT
+
 class IntentClassifier:
-    def __init__(self):
-        self.llm_client = LLMClient(GEMINI_API_KEY, LLM_MODEL_NAME)
-    
     def extract_urls(self, text: str) -> List[str]:
         """Extract URLs from text using regex."""
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        urls = re.findall(url_pattern, text)
-        return urls
+        return _URL_RE.findall(text)
+    
+    def _fallback_classification(self, detected_urls: List[str], has_media: bool) -> Dict[str, Any]:
+        """Deterministic classification used for trivial queries and when the LLM fails."""
+        if detected_urls:
+            return {
+                "intent": "misinformation_check",
+                "confidence": 0.7,
+                "detected_urls": detected_urls,
+                "has_media": has_media,
+                "requires_url_scraping": True,
+                "reasoning": "URLs detected, defaulting to misinformation check"
+            }
+        elif has_media:
+            return {
+                "intent": "ai_detection",
+                "confidence": 0.7,
+                "detected_urls": [],
+                "has_media": True,
+                "requires_url_scraping": False,
+                "reasoning": "Media present, defaulting to AI detection"
+            }
+        else:
+            return {
+                "intent": "general_chat",
+                "confidence": 0.5,
+                "detected_urls": [],
+                "has_media": False,
+                "requires_url_scraping": False,
+                "reasoning": "Fallback to general chat"
+            }
     
     async def classify(self, query: str, has_media: bool = False) -> Dict[str, Any]:
         """Classify user intent from query."""
         # First extract URLs
         detected_urls = self.extract_urls(query)
         
-        # Build prompt
-        prompt = INTENT_PROMPT.format(query=query)
+        # Skip the LLM round-trip for unambiguous queries: media with no text,
+        # (nearly) bare URLs, or empty text
+        is_blank = not query.strip()
+        is_mostly_urls = bool(detected_urls) and len(query.split()) <= len(detected_urls) * 3
+        if is_blank or is_mostly_urls:
+            result = self._fallback_classification(detected_urls, has_media)
+            logger.info(f"Intent short-circuited: {result['intent']}, URLs: {len(detected_urls)}")
+            return result
+        
+        # Repeat messages reuse the LLM verdict; URLs/media are re-merged per call below
+        cache_key = hashlib.sha1(f"{query.strip().lower()}|{has_media}".encode("utf-8")).digest()
         
         try:
-            response = await self.llm_client.model.generate_content_async(prompt)
-            text = response.text.strip()
+            llm_result = _INTENT_CACHE.get(cache_key)
+            if llm_result is None:
+                # Build prompt
+                prompt = INTENT_PROMPT.format(query=query)
+                response = await _get_llm_client().model.generate_content_async(prompt)
+                text = response.text.strip()
+                
+                # Extract JSON from response
+                json_match = _JSON_RE.search(text)
+                if json_match:
+                    llm_result = orjson.loads(json_match.group())
+                else:
+                    # Fallback parsing
+                    llm_result = orjson.loads(text)
+                # Only successful LLM classifications are cached, never fallbacks
+                _INTENT_CACHE[cache_key] = llm_result
             
-            # Extract JSON from response
-            json_match = re.search(r'\{.*\}', text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
-            else:
-                # Fallback parsing
-                result = json.loads(text)
+            result = dict(llm_result)
             
             # Merge detected URLs
             if detected_urls:
@@ -103,31 +146,4 @@ class IntentClassifier:
         except Exception as e:
             logger.error(f"Intent classification error: {e}")
             # Fallback classification
-            if detected_urls:
-                return {
-                    "intent": "misinformation_check",
-                    "confidence": 0.7,
-                    "detected_urls": detected_urls,
-                    "has_media": has_media,
-                    "requires_url_scraping": True,
-                    "reasoning": "URLs detected, defaulting to misinformation check"
-                }
-            elif has_media:
-                return {
-                    "intent": "ai_detection",
-                    "confidence": 0.7,
-                    "detected_urls": [],
-                    "has_media": True,
-                    "requires_url_scraping": False,
-                    "reasoning": "Media present, defaulting to AI detection"
-                }
-            else:
-                return {
-                    "intent": "general_chat",
-                    "confidence": 0.5,
-                    "detected_urls": [],
-                    "has_media": False,
-                    "requires_url_scraping": False,
-                    "reasoning": "Fallback to general chat"
-                }
-
+            return self._fallback_classification(detected_urls, has_media)
@@ -7,6 +7,60 @@ from chatbot.tools.general_chat_tool import GeneralChatTool
 from chatbot.tools.facts_tool import FactsLookupTool
 from chatbot.schema import MCPTool, MCPGraph
 
+# Static tool metadata (immutable, so kept at module scope)
+_PARAMS: Dict[str, Dict[str, Any]] = {
+    "misinformation_check": {
+        "claim_text": "string",
+        "use_web_search": "boolean",
+        "forced_agents": "list",
+        "media": "list",
+    },
+    "ai_detection": {
+        "file_bytes": "bytes",
+        "file_type": "string (image|video)",
+    },
+    "news_search": {
+        "query": "string",
+        "max_results": "integer",
+    },
+    "url_scraper": {
+        "urls": "list[string]",
+    },
+    "general_chat": {
+        "query": "string",
+        "conversation_history": "list",
+        "external_context": "string",
+    },
+    "facts_lookup": {
+        "query": "string",
+    },
+}
+
+_AGENTS: Dict[str, str] = {
+    "misinformation_check": "Misinformation Pipeline",
+    "ai_detection": "Sightengine API",
+    "news_search": "News Search Agent",
+    "url_scraper": "URL Scraper Agent",
+    "general_chat": "Gemini LLM",
+    "facts_lookup": "Knowledge Lookup",
+}
+
+_ENDPOINTS: Dict[str, str] = {
+    "misinformation_check": "/claims/analyze",
+    "ai_detection": "/ai-detection/analyze-image or /analyze-video",
+    "news_search": "Internal Agent",
+    "url_scraper": "Internal Agent",
+    "general_chat": "Gemini API",
+    "facts_lookup": "Wikipedia + Google",
+}
+
+# Data-flow connections between tools
+_CONNECTIONS = [
+    ("url_scraper", "misinformation_check"),
+    ("news_search", "url_scraper"),
+    ("facts_lookup", "general_chat"),
+]
+
 class MCPServer:
     """Model Context Protocol Server for tool registry and execution."""
     
@@ -20,6 +74,8 @@ class MCPServer:
             "facts_lookup": FactsLookupTool(),
         }
         self.tool_registry = self._build_registry()
+        # Tools are immutable after init, so the graph is built once
+        self._graph = self._build_graph()
     
     def _build_registry(self) -> List[MCPTool]:
         """Build tool registry with metadata."""
@@ -29,69 +85,14 @@ class MCPServer:
             registry.append(MCPTool(
                 name=name,
                 description=tool.description,
-                parameters=self._get_parameters(name),
+                parameters=_PARAMS.get(name, {}),
                 return_type="Dict[str, Any]",
-                agent=self._get_agent_name(name),
-                endpoint=self._get_endpoint(name),
+                agent=_AGENTS.get(name, "Unknown"),
+                endpoint=_ENDPOINTS.get(name, "N/A"),
             ))
         
         return registry
     
-    def _get_parameters(self, tool_name: str) -> Dict[str, Any]:
-        """Get parameters for a tool."""
-        params = {
-            "misinformation_check": {
-                "claim_text": "string",
-                "use_web_search": "boolean",
-                "forced_agents": "list",
-                "media": "list",
-            },
-            "ai_detection": {
-                "file_bytes": "bytes",
-                "file_type": "string (image|video)",
-            },
-            "news_search": {
-                "query": "string",
-                "max_results": "integer",
-            },
-            "url_scraper": {
-                "urls": "list[string]",
-            },
-            "general_chat": {
-                "query": "string",
-                "conversation_history": "list",
-                "external_context": "string",
-            },
-            "facts_lookup": {
-                "query": "string",
-            },
-        }
-        return params.get(tool_name, {})
-    
-    def _get_agent_name(self, tool_name: str) -> str:
-        """Get agent name for a tool."""
-        agents = {
-            "misinformation_check": "Misinformation Pipeline",
-            "ai_detection": "Sightengine API",
-            "news_search": "News Search Agent",
-            "url_scraper": "URL Scraper Agent",
-            "general_chat": "Gemini LLM",
-            "facts_lookup": "Knowledge Lookup",
-        }
-        return agents.get(tool_name, "Unknown")
-    
-    def _get_endpoint(self, tool_name: str) -> str:
-        """Get endpoint for a tool."""
-        endpoints = {
-            "misinformation_check": "/claims/analyze",
-            "ai_detection": "/ai-detection/analyze-image or /analyze-video",
-            "news_search": "Internal Agent",
-            "url_scraper": "Internal Agent",
-            "general_chat": "Gemini API",
-            "facts_lookup": "Wikipedia + Google",
-        }
-        return endpoints.get(tool_name, "N/A")
-    
     async def execute_tool(
         self,
         tool_name: str,
@@ -107,6 +108,10 @@ class MCPServer:
     
     def get_graph(self) -> MCPGraph:
         """Get graph representation of MCP tools and connections."""
+        return self._graph
+    
+    def _build_graph(self) -> MCPGraph:
+        """Build graph representation of MCP tools and connections."""
         nodes = []
         edges = []
         
@@ -139,13 +144,7 @@ class MCPServer:
             })
         
         # Add connections between tools
-        connections = [
-            ("url_scraper", "misinformation_check"),
-            ("news_search", "url_scraper"),
-            ("facts_lookup", "general_chat"),
-        ]
-        
-        for from_tool, to_tool in connections:
+        for from_tool, to_tool in _CONNECTIONS:
             if from_tool in self.tools and to_tool in self.tools:
                 edges.append({
                     "from": from_tool,
@@ -1,7 +1,12 @@
+import asyncio
+import re
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional, AsyncGenerator
-import uuid
+from collections import deque
+from typing import Dict, Any, List, Optional, AsyncGenerator, Awaitable, Callable, Deque
+import itertools
+import os
+import time
 from datetime import datetime
 
 # Add backend root to path
@@ -16,6 +21,44 @@ from chatbot.tools.url_scraper_tool import URLScraperTool
 
 logger = get_logger(__name__)
 
+# Same semantics as the old keyword scans: substring match for summary words,
+# question word followed by a space at the start of the message
+_SUMMARY_RE = re.compile(r"summarize|summary|recap", re.IGNORECASE)
+_QUESTION_START_RE = re.compile(r"(?:what|who|when|where|why|how|which|is|are|do|does|did|can) ", re.IGNORECASE)
+
+# Longer messages are rarely simple factual questions; don't spend a speculative lookup on them
+_SPECULATIVE_FACTS_MAX_CHARS = 300
+
+# Wrapper used when several tools contributed to one answer
+_COMBINED_RESPONSE_TEMPLATE = (
+    "<p>I've analyzed your query and gathered information from multiple sources. Here's what I found:</p>"
+    '<div class="space-y-4">{body}</div>'
+)
+
+# How long buffered tool progress may wait for more updates before it is flushed
+_PROGRESS_FLUSH_INTERVAL = 0.05
+
+# Message ids only need to be unique, not unguessable: millisecond timestamp +
+# pid + per-process counter, with no urandom syscall per chat turn
+_MESSAGE_SEQ = itertools.count()
+_PID = os.getpid() & 0xFFFF
+
+def _next_message_id() -> str:
+    """Return a monotonic (per process) 25-hex-char message id."""
+    return f"{int(time.time() * 1000):013x}{_PID:04x}{next(_MESSAGE_SEQ) & 0xFFFFFFFF:08x}"
+
+def _progress_batch_chunk(messages: List[str], message_id: str) -> Dict[str, Any]:
+    """One progress chunk for a batch; ``message`` stays the latest for existing clients."""
+    return {
+        "type": "progress",
+        "data": {"message": messages[-1], "messages": messages},
+        "message_id": message_id,
+    }
+
+def _empty_outcome() -> Dict[str, Any]:
+    """Fresh accumulator for the output of a single tool intent."""
+    return {"responses": [], "sources": [], "metadata": {}, "tools_used": []}
+
 class ChatOrchestrator:
     """Orchestrates chatbot conversations and tool execution."""
     
@@ -32,10 +75,7 @@ class ChatOrchestrator:
         conversation_history: Optional[List[Dict]] = None,
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Process user message and stream response."""
-        # Store progress callback queue
-        self._progress_queue = []
-        """Process user message and stream response."""
-        message_id = str(uuid.uuid4())
+        message_id = _next_message_id()
         
         # Classify intent
         has_media = media is not None and len(media) > 0
@@ -45,205 +85,155 @@ class ChatOrchestrator:
             "message_id": message_id,
         }
         
-        intent_result = await self.intent_classifier.classify(message, has_media)
+        # Short factual questions usually end up in general_chat -> facts_lookup,
+        # so start that lookup speculatively while the intent is classified
+        facts_task = None
+        if not has_media and len(message) <= _SPECULATIVE_FACTS_MAX_CHARS and self._wants_facts(message):
+            facts_task = asyncio.create_task(self.mcp_server.execute_tool(
+                "facts_lookup",
+                {
+                    "query": message,
+                },
+                progress_callback=None,
+            ))
+        
+        try:
+            intent_result = await self.intent_classifier.classify(message, has_media)
+        except BaseException:
+            # Includes cancellation on client disconnect; don't leak the speculative lookup
+            if facts_task:
+                facts_task.cancel()
+            raise
         intent = intent_result.get("intent", "general_chat")
         detected_urls = intent_result.get("detected_urls", [])
         
-        yield {
-            "type": "progress",
-            "data": {"message": f"Intent: {intent.replace('_', ' ').title()}"},
-            "message_id": message_id,
-        }
-        
-        # Collect results
-        all_sources = []
-        all_responses = []
-        tools_used = []
-        metadata = {}
-        
-        # Handle URL scraping first if URLs detected
-        scraped_content = ""
-        if detected_urls:
+        tool_tasks: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        try:
+            if facts_task and intent != "general_chat":
+                facts_task.cancel()
+                facts_task = None
+            
             yield {
                 "type": "progress",
-                "data": {"message": f"Scraping {len(detected_urls)} URL(s)..."},
+                "data": {"message": f"Intent: {intent.replace('_', ' ').title()}"},
                 "message_id": message_id,
             }
             
-            url_result = await self.url_scraper.execute(detected_urls)
-            if url_result.get("success"):
-                all_sources.extend(url_result.get("sources", []))
-                # Combine scraped content
-                scraped_content = "\n\n".join([
-                    f"**{item['title']}**\n{item['content']}"
-                    for item in url_result.get("scraped_content", [])
-                ])
-                tools_used.append("url_scraper")
-        
-        # Handle hybrid intents sequentially
-        if intent == "hybrid":
-            # Determine sub-intents
-            if has_media:
-                # AI detection first, then misinformation
-                intents_to_run = ["ai_detection", "misinformation_check"]
+            # Collect results
+            all_sources = []
+            all_responses = []
+            tools_used = []
+            metadata = {}
+            
+            # Resolve which tools the intent maps to
+            if intent == "hybrid":
+                # Determine sub-intents
+                if has_media:
+                    # AI detection first, then misinformation
+                    intents_to_run = ["ai_detection", "misinformation_check"]
+                else:
+                    intents_to_run = ["misinformation_check"]
             else:
-                intents_to_run = ["misinformation_check"]
-        else:
-            intents_to_run = [intent]
-        
-        # Execute tools sequentially
-        for tool_intent in intents_to_run:
-            try:
-                if tool_intent == "misinformation_check":
-                    # Combine original message with scraped content
-                    claim_text = message
-                    if scraped_content:
-                        claim_text = f"{message}\n\nScraped content:\n{scraped_content}"
-                    
-                    yield {
-                        "type": "progress",
-                        "data": {"message": "Calling misinformation pipeline..."},
-                        "message_id": message_id,
-                    }
-                    
-                    result = await self.mcp_server.execute_tool(
-                        "misinformation_check",
-                        {
-                            "claim_text": claim_text,
-                            "use_web_search": True,
-                            "media": media,
-                        },
-                        progress_callback=None,
-                    )
-                    
-                    if result.get("success"):
-                        all_responses.append(result.get("response", ""))
-                        all_sources.extend(result.get("sources", []))
-                        metadata.update(result.get("metadata", {}))
-                        tools_used.append("misinformation_check")
-                
-                elif tool_intent == "ai_detection":
-                    if not media:
-                        continue
-                    
-                    # Process first media file
-                    media_item = media[0]
-                    file_bytes = media_item.get("data")  # Base64 decoded
-                    file_type = "image" if media_item.get("type", "").startswith("image") else "video"
-                    
-                    yield {
-                        "type": "progress",
-                        "data": {"message": "Detecting AI content..."},
-                        "message_id": message_id,
-                    }
-                    
-                    result = await self.mcp_server.execute_tool(
-                        "ai_detection",
-                        {
-                            "file_bytes": file_bytes,
-                            "file_type": file_type,
-                        },
-                        progress_callback=lambda msg: self._send_progress(msg, message_id),
-                    )
-                    
-                    if result.get("success"):
-                        all_responses.append(result.get("response", ""))
-                        metadata.update(result.get("metadata", {}))
-                        tools_used.append("ai_detection")
-                
-                elif tool_intent == "news_search":
-                    yield {
-                        "type": "progress",
-                        "data": {"message": "Searching for news..."},
-                        "message_id": message_id,
-                    }
-                    
-                    result = await self.mcp_server.execute_tool(
-                        "news_search",
-                        {
-                            "query": message,
-                            "max_results": 5,
-                        },
-                        progress_callback=lambda msg: self._send_progress(msg, message_id),
-                    )
-                    
-                    if result.get("success"):
-                        all_responses.append(result.get("response", ""))
-                        all_sources.extend(result.get("sources", []))
-                        metadata.update(result.get("metadata", {}))
-                        tools_used.append("news_search")
+                intents_to_run = [intent]
+            
+            # Independent tools run concurrently; their progress is buffered and
+            # flushed in small batches so bursts of updates share one SSE frame
+            progress_buffer: Deque[str] = deque()
+            progress_ready = asyncio.Event()
+            
+            async def report_progress(progress_message: str) -> None:
+                progress_buffer.append(progress_message)
+                progress_ready.set()
+            
+            def start_tool(tool_intent: str, claim_text: str) -> "asyncio.Task[Dict[str, Any]]":
+                return asyncio.create_task(self._run_tool(
+                    tool_intent,
+                    message=message,
+                    claim_text=claim_text,
+                    media=media,
+                    conversation_history=conversation_history,
+                    report_progress=report_progress,
+                    facts_task=facts_task,
+                ))
+            
+            # Only the misinformation pipeline consumes scraped content, so every
+            # other tool (e.g. the Sightengine upload for hybrid media) starts now
+            # and overlaps the URL scrape
+            for tool_intent in intents_to_run:
+                if tool_intent != "misinformation_check":
+                    tool_tasks[tool_intent] = start_tool(tool_intent, message)
+            
+            # Handle URL scraping if URLs detected
+            scraped_content = ""
+            if detected_urls:
+                yield {
+                    "type": "progress",
+                    "data": {"message": f"Scraping {len(detected_urls)} URL(s)..."},
+                    "message_id": message_id,
+                }
                 
-                elif tool_intent == "general_chat":
-                    message_lower = message.strip().lower()
-                    summary_keywords = ("summarize", "summary", "recap")
-                    question_keywords = ("what", "who", "when", "where", "why", "how", "which", "is", "are", "do", "does", "did", "can")
-                    
-                    is_summary_request = any(kw in message_lower for kw in summary_keywords)
-                    is_question = message.strip().endswith("?") or any(
-                        message_lower.startswith(f"{kw} ") for kw in question_keywords
+                url_result = await self.url_scraper.execute(detected_urls)
+                if url_result.get("success"):
+                    all_sources.extend(url_result.get("sources", []))
+                    # Combine scraped content
+                    scraped_content = "\n\n".join(
+                        "**" + item["title"] + "**\n" + item["content"]
+                        for item in url_result.get("scraped_content", [])
                     )
-                    
-                    used_facts = False
-                    if is_question and not is_summary_request:
-                        yield {
-                            "type": "progress",
-                            "data": {"message": "Retrieving factual sources..."},
-                            "message_id": message_id,
-                        }
-                        try:
-                            facts_result = await self.mcp_server.execute_tool(
-                                "facts_lookup",
-                                {
-                                    "query": message,
-                                },
-                                progress_callback=None,
-                            )
-                            if facts_result.get("success") and facts_result.get("response"):
-                                all_responses.append(facts_result.get("response", ""))
-                                all_sources.extend(facts_result.get("sources", []))
-                                metadata.update({"facts_lookup": facts_result.get("metadata", {})})
-                                tools_used.append("facts_lookup")
-                                used_facts = True
-                        except Exception as facts_error:
-                            logger.error(f"Facts lookup tool error: {facts_error}")
-                    
-                    if used_facts:
-                        continue
-                    
-                    yield {
-                        "type": "progress",
-                        "data": {"message": "Generating response..."},
-                        "message_id": message_id,
-                    }
-                    
-                    result = await self.mcp_server.execute_tool(
-                        "general_chat",
-                        {
-                            "query": message,
-                            "conversation_history": conversation_history,
-                        },
-                        progress_callback=None,
-                    )
-                    
-                    if result.get("success"):
-                        all_responses.append(result.get("response", ""))
-                        tools_used.append("general_chat")
+                    tools_used.append("url_scraper")
+            
+            # Claim text for the misinformation pipeline is built once per message
+            claim_text = message
+            if scraped_content:
+                claim_text = message + "\n\nScraped content:\n" + scraped_content
+            
+            if "misinformation_check" in intents_to_run:
+                tool_tasks["misinformation_check"] = start_tool("misinformation_check", claim_text)
+            tools_done = asyncio.gather(
+                *(tool_tasks[tool_intent] for tool_intent in intents_to_run),
+                return_exceptions=True,
+            )
             
-            except Exception as e:
-                logger.error(f"Error executing tool {tool_intent}: {e}")
-                # Continue with other tools
-                continue
+            while not tools_done.done():
+                progress_wait = asyncio.ensure_future(progress_ready.wait())
+                await asyncio.wait({tools_done, progress_wait}, return_when=asyncio.FIRST_COMPLETED)
+                progress_wait.cancel()
+                if progress_buffer and not tools_done.done():
+                    # Give closely spaced updates a moment to coalesce
+                    await asyncio.wait({tools_done}, timeout=_PROGRESS_FLUSH_INTERVAL)
+                if progress_buffer:
+                    batch = list(progress_buffer)
+                    progress_buffer.clear()
+                    progress_ready.clear()
+                    yield _progress_batch_chunk(batch, message_id)
+            
+            if progress_buffer:
+                yield _progress_batch_chunk(list(progress_buffer), message_id)
+            
+            # Merge in intent order so combined output is deterministic
+            for tool_intent, outcome in zip(intents_to_run, tools_done.result()):
+                # gather(return_exceptions=True) also returns CancelledError, a BaseException
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Error executing tool {tool_intent}: {outcome}")
+                    continue
+                all_responses.extend(outcome["responses"])
+                all_sources.extend(outcome["sources"])
+                metadata.update(outcome["metadata"])
+                tools_used.extend(outcome["tools_used"])
+        finally:
+            # The SSE generator is closed on client disconnect, and a later step may raise;
+            # either way, stop tools that are still calling paid upstream APIs
+            for task in tool_tasks.values():
+                task.cancel()
+            if facts_task:
+                facts_task.cancel()
         
         # Combine responses into a natural, conversational format
         if all_responses:
             # If multiple responses, combine them naturally
             if len(all_responses) > 1:
-                combined_response = f"""
-                <p>I've analyzed your query and gathered information from multiple sources. Here's what I found:</p>
-                <div class="space-y-4">
-                {''.join([f'<div>{resp}</div>' for resp in all_responses])}
-                </div>
-                """
+                body = "".join("<div>" + resp + "</div>" for resp in all_responses)
+                combined_response = _COMBINED_RESPONSE_TEMPLATE.format(body=body)
             else:
                 combined_response = all_responses[0]
         else:
@@ -273,8 +263,161 @@ class ChatOrchestrator:
             "message_id": message_id,
         }
     
-    def _send_progress(self, message: str, message_id: str) -> None:
-        """Helper to send progress updates (used in callbacks)."""
-        # This will be handled by the streaming generator
-        pass
-
+    def _wants_facts(self, message: str) -> bool:
+        """Whether a general-chat message is a factual question worth a facts lookup."""
+        stripped = message.strip()
+        is_summary_request = _SUMMARY_RE.search(stripped) is not None
+        is_question = stripped.endswith("?") or _QUESTION_START_RE.match(stripped) is not None
+        return is_question and not is_summary_request
+    
+    async def _run_tool(
+        self,
+        tool_intent: str,
+        message: str,
+        claim_text: str,
+        media: Optional[List[Dict]],
+        conversation_history: Optional[List[Dict]],
+        report_progress: Callable[[str], Awaitable[None]],
+        facts_task: Optional["asyncio.Task[Dict[str, Any]]"] = None,
+    ) -> Dict[str, Any]:
+        """Run the tool(s) behind a single intent and collect their output."""
+        if tool_intent == "misinformation_check":
+            return await self._run_misinformation(claim_text, media, report_progress)
+        elif tool_intent == "ai_detection":
+            return await self._run_ai_detection(media, report_progress)
+        elif tool_intent == "news_search":
+            return await self._run_news_search(message, report_progress)
+        elif tool_intent == "general_chat":
+            return await self._run_general_chat(message, conversation_history, report_progress, facts_task)
+        return _empty_outcome()
+    
+    async def _run_misinformation(
+        self,
+        claim_text: str,
+        media: Optional[List[Dict]],
+        report_progress: Callable[[str], Awaitable[None]],
+    ) -> Dict[str, Any]:
+        outcome = _empty_outcome()
+        
+        await report_progress("Calling misinformation pipeline...")
+        
+        result = await self.mcp_server.execute_tool(
+            "misinformation_check",
+            {
+                "claim_text": claim_text,
+                "use_web_search": True,
+                "media": media,
+            },
+            progress_callback=None,
+        )
+        
+        if result.get("success"):
+            outcome["responses"].append(result.get("response", ""))
+            outcome["sources"].extend(result.get("sources", []))
+            outcome["metadata"].update(result.get("metadata", {}))
+            outcome["tools_used"].append("misinformation_check")
+        return outcome
+    
+    async def _run_ai_detection(
+        self,
+        media: Optional[List[Dict]],
+        report_progress: Callable[[str], Awaitable[None]],
+    ) -> Dict[str, Any]:
+        outcome = _empty_outcome()
+        if not media:
+            return outcome
+        
+        # Process first media file
+        media_item = media[0]
+        file_bytes = media_item.get("data")  # Raw upload bytes
+        file_type = "image" if media_item.get("type", "").startswith("image") else "video"
+        
+        await report_progress("Detecting AI content...")
+        
+        result = await self.mcp_server.execute_tool(
+            "ai_detection",
+            {
+                "file_bytes": file_bytes,
+                "file_type": file_type,
+            },
+            progress_callback=report_progress,
+        )
+        
+        if result.get("success"):
+            outcome["responses"].append(result.get("response", ""))
+            outcome["metadata"].update(result.get("metadata", {}))
+            outcome["tools_used"].append("ai_detection")
+        return outcome
+    
+    async def _run_news_search(
+        self,
+        message: str,
+        report_progress: Callable[[str], Awaitable[None]],
+    ) -> Dict[str, Any]:
+        outcome = _empty_outcome()
+        
+        await report_progress("Searching for news...")
+        
+        result = await self.mcp_server.execute_tool(
+            "news_search",
+            {
+                "query": message,
+                "max_results": 5,
+            },
+            progress_callback=report_progress,
+        )
+        
+        if result.get("success"):
+            outcome["responses"].append(result.get("response", ""))
+            outcome["sources"].extend(result.get("sources", []))
+            outcome["metadata"].update(result.get("metadata", {}))
+            outcome["tools_used"].append("news_search")
+        return outcome
+    
+    async def _run_general_chat(
+        self,
+        message: str,
+        conversation_history: Optional[List[Dict]],
+        report_progress: Callable[[str], Awaitable[None]],
+        facts_task: Optional["asyncio.Task[Dict[str, Any]]"] = None,
+    ) -> Dict[str, Any]:
+        outcome = _empty_outcome()
+        
+        if facts_task or self._wants_facts(message):
+            await report_progress("Retrieving factual sources...")
+            try:
+                if facts_task:
+                    # Reuse the lookup started alongside intent classification
+                    facts_result = await facts_task
+                else:
+                    facts_result = await self.mcp_server.execute_tool(
+                        "facts_lookup",
+                        {
+                            "query": message,
+                        },
+                        progress_callback=None,
+                    )
+                if facts_result.get("success") and facts_result.get("response"):
+                    outcome["responses"].append(facts_result.get("response", ""))
+                    outcome["sources"].extend(facts_result.get("sources", []))
+                    outcome["metadata"].update({"facts_lookup": facts_result.get("metadata", {})})
+                    outcome["tools_used"].append("facts_lookup")
+                    return outcome
+            except Exception as facts_error:
+                logger.error(f"Facts lookup tool error: {facts_error}")
+        
+        await report_progress("Generating response...")
+        
+        result = await self.mcp_server.execute_tool(
+            "general_chat",
+            {
+                "query": message,
+                "conversation_history": conversation_history,
+            },
+            progress_callback=None,
+        )
+        
+        if result.get("success"):
+            outcome["responses"].append(result.get("response", ""))
+            outcome["tools_used"].append("general_chat")
+        return outcome
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form
 from fastapi.responses import StreamingResponse
 from typing import Optional, List
-import json
+import asyncio
+import httpx
+import orjson
 import sys
 from pathlib import Path
 from datetime import datetime
-import base64
 
 # Add backend root to path
 BACKEND_ROOT = Path(__file__).resolve().parent.parent
@@ -17,15 +18,31 @@ from database import db, get_next_sequence
 from logger import get_logger
 from chatbot.schema import ChatRequest, ChatResponse, StreamingChunk, MCPGraph
 from chatbot.orchestrator import ChatOrchestrator
-from chatbot.mcp_server import MCPServer
 from config import ASSEMBLY_AI_API_KEY
 
 logger = get_logger(__name__)
 router = APIRouter()
 
-# Initialize orchestrator and MCP server
+# Initialize orchestrator (it owns the MCP server used by /mcp/graph too)
 orchestrator = ChatOrchestrator()
-mcp_server = MCPServer()
+
+# Number of most recent messages loaded as context for each chat turn
+CONTEXT_HISTORY_MESSAGES = 20
+
+# Pooled AssemblyAI client so TLS sessions and keep-alive connections are reused
+_assembly_client = httpx.AsyncClient(
+    base_url="https://api.assemblyai.com",
+    timeout=60.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+)
+
+def _sse_frame(payload: dict) -> bytes:
+    """Encode a payload as a ready-to-send SSE ``data:`` frame."""
+    return b"data: " + orjson.dumps(payload, default=str) + b"\n\n"
+
+async def close_assembly_client() -> None:
+    """Close the shared AssemblyAI HTTP client (called on app shutdown)."""
+    await _assembly_client.aclose()
 
 @router.post("/chat")
 async def chat(
@@ -49,6 +66,7 @@ async def chat(
             "createdAt": datetime.utcnow(),
             "updatedAt": datetime.utcnow(),
             "messages": [],
+            "messageCount": 0,
         })
     
     # Process media files
@@ -62,17 +80,19 @@ async def chat(
                 "filename": file.filename,
             })
     
-    # Get conversation history
-    conv_doc = await db.conversations.find_one({"conversationId": conversation_id})
+    # Get conversation history (only the recent turns are useful as prompt context)
+    conv_doc = await db.conversations.find_one(
+        {"conversationId": conversation_id},
+        projection={"messages": {"$slice": -CONTEXT_HISTORY_MESSAGES}},
+    )
     conversation_history = conv_doc.get("messages", []) if conv_doc else []
     
-    # Save user message
+    # User message is persisted together with the reply once streaming finishes
     user_message = {
         "role": "user",
         "content": message,
         "timestamp": datetime.utcnow(),
     }
-    conversation_history.append(user_message)
     
     async def generate_stream():
         message_id = None
@@ -100,7 +120,7 @@ async def chat(
                 
                 if chunk_type == "progress":
                     # Send progress update
-                    yield f"data: {json.dumps({'type': 'progress', 'data': chunk_data, 'message_id': message_id})}\n\n"
+                    yield _sse_frame({'type': 'progress', 'data': chunk_data, 'message_id': message_id})
                 
                 elif chunk_type == "content":
                     # Update assistant message
@@ -108,30 +128,28 @@ async def chat(
                     assistant_message["sources"] = chunk_data.get("sources", [])
                     assistant_message["citations"] = chunk_data.get("citations", [])
                     chunk_data["conversation_id"] = conversation_id
-                    yield f"data: {json.dumps({'type': 'content', 'data': chunk_data, 'message_id': message_id})}\n\n"
+                    yield _sse_frame({'type': 'content', 'data': chunk_data, 'message_id': message_id})
                 
                 elif chunk_type == "complete":
                     assistant_message["intent"] = chunk_data.get("intent")
                     assistant_message["tools_used"] = chunk_data.get("tools_used", [])
                     assistant_message["metadata"] = chunk_data.get("metadata", {})
                     chunk_data["conversation_id"] = conversation_id
-                    yield f"data: {json.dumps({'type': 'complete', 'data': chunk_data, 'message_id': message_id})}\n\n"
+                    yield _sse_frame({'type': 'complete', 'data': chunk_data, 'message_id': message_id})
             
-            # Save assistant message to conversation
-            conversation_history.append(assistant_message)
+            # Append just this turn instead of rewriting the whole messages array
             await db.conversations.update_one(
                 {"conversationId": conversation_id},
                 {
-                    "$set": {
-                        "messages": conversation_history,
-                        "updatedAt": datetime.utcnow(),
-                    }
+                    "$push": {"messages": {"$each": [user_message, assistant_message]}},
+                    "$set": {"updatedAt": datetime.utcnow()},
+                    "$inc": {"messageCount": 2},
                 }
             )
             
         except Exception as e:
             logger.error(f"Chat streaming error: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'data': {'error': str(e)}, 'message_id': message_id})}\n\n"
+            yield _sse_frame({'type': 'error', 'data': {'error': str(e)}, 'message_id': message_id})
     
     return StreamingResponse(generate_stream(), media_type="text/event-stream")
 
@@ -163,8 +181,10 @@ async def list_conversations(
     """List all conversations for user."""
     user_id = current_user.get("user_id") or str(current_user["_id"])
     
+    # messages can be large; the count is kept denormalized in messageCount
     conversations = await db.conversations.find(
-        {"userId": user_id}
+        {"userId": user_id},
+        projection={"conversationId": 1, "createdAt": 1, "updatedAt": 1, "messageCount": 1},
     ).sort("updatedAt", -1).limit(50).to_list(length=None)
     
     return {
@@ -173,7 +193,7 @@ async def list_conversations(
                 "conversation_id": conv["conversationId"],
                 "created_at": conv["createdAt"].isoformat(),
                 "updated_at": conv["updatedAt"].isoformat(),
-                "message_count": len(conv.get("messages", [])),
+                "message_count": conv.get("messageCount", 0),
             }
             for conv in conversations
         ]
@@ -206,83 +226,82 @@ async def transcribe_audio(
     logger.info(f"Transcribing audio for user {user_id}, size={len(audio_bytes)} bytes")
     
     # Use Assembly AI transcription with proper error handling
-    import httpx
-    import asyncio
-    
-    ASSEMBLY_BASE_URL = "https://api.assemblyai.com"
     headers = {"authorization": ASSEMBLY_AI_API_KEY}
     
     try:
         # Upload audio
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            upload_response = await client.post(
-                f"{ASSEMBLY_BASE_URL}/v2/upload",
+        upload_response = await _assembly_client.post(
+            "/v2/upload",
+            headers=headers,
+            content=audio_bytes,
+        )
+        if upload_response.status_code >= 400:
+            logger.error(f"AssemblyAI upload failed: {upload_response.text}")
+            raise HTTPException(
+                status_code=502,
+                detail=f"AssemblyAI upload failed: {upload_response.text}",
+            )
+        upload_data = upload_response.json()
+        audio_url = upload_data.get("upload_url")
+        if not audio_url:
+            raise HTTPException(status_code=502, detail="Invalid upload response from AssemblyAI.")
+        
+        # Create transcript
+        transcript_response = await _assembly_client.post(
+            "/v2/transcript",
+            headers={**headers, "content-type": "application/json"},
+            json={"audio_url": audio_url},
+        )
+        if transcript_response.status_code >= 400:
+            logger.error(f"AssemblyAI transcription request failed: {transcript_response.text}")
+            raise HTTPException(
+                status_code=502,
+                detail=f"AssemblyAI transcription request failed: {transcript_response.text}",
+            )
+        transcript_data = transcript_response.json()
+        transcript_id = transcript_data.get("id")
+        if not transcript_id:
+            raise HTTPException(status_code=502, detail="Invalid transcript response from AssemblyAI.")
+        
+        # Poll for completion
+        start_time = asyncio.get_event_loop().time()
+        timeout_seconds = 120
+        # Short dictation usually finishes within a couple of seconds, so start
+        # polling fast and back off towards the old fixed 2s interval
+        poll_interval = 0.2
+        max_poll_interval = 2.0
+        
+        while True:
+            status_response = await _assembly_client.get(
+                f"/v2/transcript/{transcript_id}",
                 headers=headers,
-                content=audio_bytes,
             )
-            if upload_response.status_code >= 400:
-                logger.error(f"AssemblyAI upload failed: {upload_response.text}")
+            if status_response.status_code >= 400:
+                logger.error(f"AssemblyAI polling failed: {status_response.text}")
                 raise HTTPException(
                     status_code=502,
-                    detail=f"AssemblyAI upload failed: {upload_response.text}",
+                    detail=f"AssemblyAI polling failed: {status_response.text}",
                 )
-            upload_data = upload_response.json()
-            audio_url = upload_data.get("upload_url")
-            if not audio_url:
-                raise HTTPException(status_code=502, detail="Invalid upload response from AssemblyAI.")
+            status_data = status_response.json()
+            status_value = status_data.get("status")
             
-            # Create transcript
-            transcript_response = await client.post(
-                f"{ASSEMBLY_BASE_URL}/v2/transcript",
-                headers={**headers, "content-type": "application/json"},
-                json={"audio_url": audio_url},
-            )
-            if transcript_response.status_code >= 400:
-                logger.error(f"AssemblyAI transcription request failed: {transcript_response.text}")
+            if status_value == "completed":
+                transcript_text = status_data.get("text", "")
+                logger.info(f"Audio transcription completed for user {user_id}, transcript_length={len(transcript_text)}")
+                return {"text": transcript_text}
+            elif status_value == "error":
+                error_msg = status_data.get("error", "Unknown error")
+                logger.error(f"Transcription failed: {error_msg}")
                 raise HTTPException(
                     status_code=502,
-                    detail=f"AssemblyAI transcription request failed: {transcript_response.text}",
+                    detail=f"Transcription failed: {error_msg}",
                 )
-            transcript_data = transcript_response.json()
-            transcript_id = transcript_data.get("id")
-            if not transcript_id:
-                raise HTTPException(status_code=502, detail="Invalid transcript response from AssemblyAI.")
             
-            # Poll for completion
-            start_time = asyncio.get_event_loop().time()
-            timeout_seconds = 120
-            poll_interval = 2.0
+            if asyncio.get_event_loop().time() - start_time > timeout_seconds:
+                raise HTTPException(status_code=504, detail="AssemblyAI transcription timed out.")
             
-            while True:
-                status_response = await client.get(
-                    f"{ASSEMBLY_BASE_URL}/v2/transcript/{transcript_id}",
-                    headers=headers,
-                )
-                if status_response.status_code >= 400:
-                    logger.error(f"AssemblyAI polling failed: {status_response.text}")
-                    raise HTTPException(
-                        status_code=502,
-                        detail=f"AssemblyAI polling failed: {status_response.text}",
-                    )
-                status_data = status_response.json()
-                status_value = status_data.get("status")
-                
-                if status_value == "completed":
-                    transcript_text = status_data.get("text", "")
-                    logger.info(f"Audio transcription completed for user {user_id}, transcript_length={len(transcript_text)}")
-                    return {"text": transcript_text}
-                elif status_value == "error":
-                    error_msg = status_data.get("error", "Unknown error")
-                    logger.error(f"Transcription failed: {error_msg}")
-                    raise HTTPException(
-                        status_code=502,
-                        detail=f"Transcription failed: {error_msg}",
-                    )
-                
-                if asyncio.get_event_loop().time() - start_time > timeout_seconds:
-                    raise HTTPException(status_code=504, detail="AssemblyAI transcription timed out.")
-                
-                await asyncio.sleep(poll_interval)
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 1.5, max_poll_interval)
     except HTTPException:
         raise
     except Exception as e:
@@ -297,6 +316,6 @@ async def get_mcp_graph(
     current_user: dict = Depends(get_current_user),
 ):
     """Get MCP graph representation."""
-    graph = mcp_server.get_graph()
+    graph = orchestrator.mcp_server.get_graph()
     return graph.model_dump()
 
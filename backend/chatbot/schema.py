@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -28,11 +28,15 @@ class ChatResponse(BaseModel):
     message_id: str
 
 class StreamingChunk(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     type: str  # "progress", "content", "sources", "complete"
     data: Dict[str, Any]
     message_id: str
 
 class MCPTool(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     parameters: Dict[str, Any]
@@ -41,6 +45,8 @@ class MCPTool(BaseModel):
     endpoint: Optional[str] = None
 
 class MCPGraph(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     nodes: List[Dict[str, Any]]
     edges: List[Dict[str, Any]]
     tools: List[MCPTool]
@@ -0,0 +1,30 @@
+"""Shared misinformation-agent settings for the chatbot tools.
+
+Importing this module puts misinformation-agent on sys.path and executes its
+config.py exactly once per process; tools import the constants they need from here.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+MISINFO_DIR = Path(__file__).resolve().parent.parent.parent / "misinformation-agent"
+if str(MISINFO_DIR) not in sys.path:
+    sys.path.insert(0, str(MISINFO_DIR))
+
+
+def _load_app_config() -> Dict[str, Any]:
+    spec = importlib.util.spec_from_file_location("misinfo_config", MISINFO_DIR / "config.py")
+    if not (spec and spec.loader):
+        return {}
+    misinfo_config = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(misinfo_config)
+    sys.modules["misinfo_config"] = misinfo_config
+    return misinfo_config.APP_CONFIG
+
+
+APP_CONFIG: Dict[str, Any] = _load_app_config()
+GEMINI_API_KEY: str = APP_CONFIG.get("GOOGLE_CLOUD_API_KEY", "")
+LLM_MODEL_NAME: str = APP_CONFIG.get("LLM_MODEL_NAME", "gemini-2.0-flash-exp")
+SERPAPI_API_KEY: str = APP_CONFIG.get("SERPAPI_API_KEY", "")
+FIRECRAWL_API_KEY: str = APP_CONFIG.get("FIRECRAWL_API_KEY", "")
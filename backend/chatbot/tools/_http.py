@@ -0,0 +1,34 @@
+from typing import Optional
+
+import httpx
+
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client shared by the chatbot tools.
+
+    Created lazily so it is opened from inside the running event loop, then reused
+    so TCP/TLS connections to each upstream host are kept alive across tool calls.
+    """
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=16,
+                max_connections=64,
+                keepalive_expiry=60.0,
+            ),
+            headers={"User-Agent": "Aletheia/1.0"},
+            follow_redirects=True,
+        )
+    return _CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared chatbot tools HTTP client (called on app shutdown)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
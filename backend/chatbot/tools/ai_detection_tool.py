@@ -1,7 +1,6 @@
 import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
-import httpx
 
 # Add backend root to path
 BACKEND_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -9,11 +8,26 @@ if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
 from logger import get_logger
-from ai_detection.service import analyze_image_sightengine, analyze_video_sightengine, get_confidence_level
-from config import SIGHTENGINE_API_USER, SIGHTENGINE_API_SECRET
+from ai_detection.service import analyze_image_sightengine, analyze_video_sightengine, average_frame_score, get_confidence_level
 
 logger = get_logger(__name__)
 
+# Heading color and interpretation text per confidence level
+_LEVEL_PRESENTATION = {
+    "High": ("red", "High probability of AI-generated content detected."),
+    "Medium": ("yellow", "Medium probability - content may be AI-generated."),
+    "Low": ("green", "Low probability - content appears to be human-generated."),
+}
+
+_RESPONSE_TEMPLATE = """<div>
+            <h3 style="color: {color}; margin-bottom: 12px;">Status: {status}</h3>
+            <p style="margin-bottom: 12px;"><strong>AI Score:</strong> {score_pct:.1f}%</p>
+            <p style="margin-bottom: 12px;"><strong>Confidence Level:</strong> {confidence_level}</p>
+            <p>
+                {interpretation}
+            </p>
+        </div>"""
+
 class AIDetectionTool:
     """Tool for AI content detection."""
     
@@ -46,15 +60,7 @@ class AIDetectionTool:
                 # Video has frames array
                 frames = result.get("data", {}).get("frames", [])
                 if frames:
-                    frame_scores = [
-                        frame.get("type", {}).get("ai_generated", 0.0)
-                        for frame in frames
-                        if frame.get("type", {}).get("ai_generated") is not None
-                    ]
-                    if frame_scores:
-                        ai_score = sum(frame_scores) / len(frame_scores)
-                    else:
-                        ai_score = 0.0
+                    ai_score = average_frame_score(frames)
                 else:
                     ai_score = result.get("type", {}).get("ai_generated", 0.0)
             else:
@@ -89,26 +95,11 @@ class AIDetectionTool:
     
     def _format_response(self, ai_score: float, is_ai_generated: bool, confidence_level: str) -> str:
         """Format response as HTML."""
-        color = "red" if confidence_level == "High" else ("yellow" if confidence_level == "Medium" else "green")
-        status = "AI Generated" if is_ai_generated else "Human Generated"
-        
-        html = f"""
-        <div>
-            <h3 style="color: {color}; margin-bottom: 12px;">Status: {status}</h3>
-            <p style="margin-bottom: 12px;"><strong>AI Score:</strong> {ai_score * 100:.1f}%</p>
-            <p style="margin-bottom: 12px;"><strong>Confidence Level:</strong> {confidence_level}</p>
-            <p>
-                {self._get_interpretation(confidence_level)}
-            </p>
-        </div>
-        """
-        return html.strip()
-    
-    def _get_interpretation(self, level: str) -> str:
-        if level == "High":
-            return "High probability of AI-generated content detected."
-        elif level == "Medium":
-            return "Medium probability - content may be AI-generated."
-        else:
-            return "Low probability - content appears to be human-generated."
-
+        color, interpretation = _LEVEL_PRESENTATION.get(confidence_level, _LEVEL_PRESENTATION["Low"])
+        return _RESPONSE_TEMPLATE.format(
+            color=color,
+            status="AI Generated" if is_ai_generated else "Human Generated",
+            score_pct=ai_score * 100,
+            confidence_level=confidence_level,
+            interpretation=interpretation,
+        )
@@ -1,9 +1,12 @@
 import sys
 import asyncio
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from urllib.parse import quote
 
-import wikipedia
+import httpx
+import orjson
+from cachetools import TTLCache
 
 # Add backend root to path
 BACKEND_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -11,20 +14,8 @@ if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
 from logger import get_logger
-import importlib.util
-
-MISINFO_DIR = BACKEND_ROOT / "misinformation-agent"
-if str(MISINFO_DIR) not in sys.path:
-    sys.path.insert(0, str(MISINFO_DIR))
-
-misinfo_config_path = MISINFO_DIR / "config.py"
-spec = importlib.util.spec_from_file_location("misinfo_config", misinfo_config_path)
-if spec and spec.loader:
-    misinfo_config = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(misinfo_config)
-    APP_CONFIG = misinfo_config.APP_CONFIG
-else:
-    APP_CONFIG = {}
+from chatbot.tools._http import get_client
+from chatbot.tools._config import SERPAPI_API_KEY
 
 from models.claim import Claim  # type: ignore
 from agents.data_collection import web_search_agent  # type: ignore
@@ -32,6 +23,23 @@ from agents.data_collection import web_search_agent  # type: ignore
 
 logger = get_logger(__name__)
 
+# Lookups are near-idempotent over minutes, and users often retry or rephrase slightly
+_WIKI_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=600)
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=120)
+
+
+_LINK_ITEM_TEMPLATE = """<li>
+                        <a href="{url}" target="_blank">{title}</a>
+                        </li>"""
+
+_WIKI_BASE_URL = "https://en.wikipedia.org"
+# Wikipedia calls are short; fail fast rather than hold up the facts response
+_WIKI_TIMEOUT = httpx.Timeout(5.0)
+
+
+def _cache_key(query: str) -> str:
+    return query.strip().lower()
+
 
 class FactsLookupTool:
     """Tool for quick factual lookups using Wikipedia and Google (SerpApi)."""
@@ -39,12 +47,26 @@ class FactsLookupTool:
     def __init__(self):
         self.name = "facts_lookup"
         self.description = "Fetches factual answers from Wikipedia and Google search snippets"
-        self.serpapi_api_key = APP_CONFIG.get("SERPAPI_API_KEY")
+        self.serpapi_api_key = SERPAPI_API_KEY
 
-    async def execute(self, query: str) -> Dict[str, Any]:
+    async def execute(
+        self,
+        query: str,
+        progress_callback: Optional[callable] = None,
+    ) -> Dict[str, Any]:
         try:
-            wikipedia_summary = await self._fetch_wikipedia_summary(query)
-            search_results = await self._fetch_search_results(query)
+            # Independent lookups against different hosts; overlap them
+            wikipedia_summary, search_results = await asyncio.gather(
+                self._fetch_wikipedia_summary(query),
+                self._fetch_search_results(query),
+                return_exceptions=True,
+            )
+            if isinstance(wikipedia_summary, Exception):
+                logger.warning(f"Wikipedia lookup failed for '{query}': {wikipedia_summary}")
+                wikipedia_summary = {}
+            if isinstance(search_results, Exception):
+                logger.warning(f"Google search failed for '{query}': {search_results}")
+                search_results = []
 
             response_html = self._format_response(query, wikipedia_summary, search_results)
 
@@ -89,37 +111,69 @@ class FactsLookupTool:
             }
 
     async def _fetch_wikipedia_summary(self, query: str) -> Dict[str, str]:
+        key = _cache_key(query)
+        cached = _WIKI_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         summary_data: Dict[str, str] = {}
-        loop = asyncio.get_running_loop()
 
         try:
-            page_title = await loop.run_in_executor(None, lambda: wikipedia.search(query, results=1))
-            if not page_title:
-                return summary_data
-
-            title = page_title[0]
-
-            summary = await loop.run_in_executor(
-                None, lambda: wikipedia.summary(title, sentences=3, auto_suggest=False)
-            )
-            url = await loop.run_in_executor(
-                None, lambda: wikipedia.page(title, auto_suggest=False).url
+            # Full-text search, like wikipedia.search: queries here are question-shaped,
+            # so they rarely match a title exactly or as a prefix
+            response = await get_client().get(
+                f"{_WIKI_BASE_URL}/w/api.php",
+                params={
+                    "action": "query",
+                    "list": "search",
+                    "srsearch": query,
+                    "srlimit": 1,
+                    "srprop": "",
+                    "format": "json",
+                },
+                timeout=_WIKI_TIMEOUT,
             )
+            response.raise_for_status()
+            hits = orjson.loads(response.content).get("query", {}).get("search", [])
+            if not hits:
+                return summary_data
+            page = await self._fetch_page_summary(hits[0]["title"])
+            if page is None:
+                return summary_data
 
             summary_data = {
-                "title": title,
-                "summary": summary,
-                "url": url,
+                "title": page.get("title", query),
+                "summary": page.get("extract", ""),
+                "url": page.get("content_urls", {}).get("desktop", {}).get("page", ""),
             }
+            # Only successful lookups are cached so transient failures get retried
+            _WIKI_CACHE[key] = summary_data
         except Exception as e:
             logger.warning(f"Wikipedia lookup failed for '{query}': {e}")
 
         return summary_data
 
+    async def _fetch_page_summary(self, title: str) -> Optional[Dict[str, Any]]:
+        """Fetch a page's REST summary, or None if no article has that title."""
+        # The REST summary endpoint returns title, extract and canonical URL in one response
+        response = await get_client().get(
+            f"{_WIKI_BASE_URL}/api/rest_v1/page/summary/{quote(title.replace(' ', '_'), safe='')}",
+            timeout=_WIKI_TIMEOUT,
+        )
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     async def _fetch_search_results(self, query: str) -> List[Dict[str, str]]:
         if not self.serpapi_api_key:
             return []
 
+        key = _cache_key(query)
+        cached = _SEARCH_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         try:
             claim = Claim(text=query)
             urls = await web_search_agent.run(
@@ -127,7 +181,7 @@ class FactsLookupTool:
                 serpapi_api_key=self.serpapi_api_key,
                 smart_query=query,
             )
-            return [
+            results = [
                 {
                     "title": url,
                     "url": url,
@@ -135,6 +189,9 @@ class FactsLookupTool:
                 }
                 for url in urls[:3]
             ]
+            if results:
+                _SEARCH_CACHE[key] = results
+            return results
         except Exception as e:
             logger.warning(f"Google search failed for '{query}': {e}")
             return []
@@ -163,12 +220,12 @@ class FactsLookupTool:
 
         if search_results:
             sections.append("<h4>Additional Web References</h4><ul>")
-            for result in search_results:
-                sections.append(
-                    f"""<li>
-                        <a href="{result.get('url', '#')}" target="_blank">{result.get('title', 'Web Result')}</a>
-                        </li>"""
+            sections.extend(
+                _LINK_ITEM_TEMPLATE.format(
+                    url=result.get('url', '#'), title=result.get('title', 'Web Result')
                 )
+                for result in search_results
+            )
             sections.append("</ul>")
 
         return "\n".join(sections)
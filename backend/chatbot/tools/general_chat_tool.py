@@ -1,6 +1,10 @@
+import re
 import sys
 from pathlib import Path
 from typing import Dict, Any, Optional, List
+import functools
+
+from selectolax.parser import HTMLParser
 
 # Add backend root to path
 BACKEND_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -8,36 +12,63 @@ if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
 from logger import get_logger
-import importlib.util
-from pathlib import Path
-
-# Import from misinformation-agent config
-MISINFO_DIR = Path(__file__).resolve().parent.parent.parent / "misinformation-agent"
-misinfo_config_path = MISINFO_DIR / "config.py"
-spec = importlib.util.spec_from_file_location("misinfo_config", misinfo_config_path)
-if spec and spec.loader:
-    misinfo_config = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(misinfo_config)
-    GEMINI_API_KEY = misinfo_config.APP_CONFIG.get("GOOGLE_CLOUD_API_KEY", "")
-    LLM_MODEL_NAME = misinfo_config.APP_CONFIG.get("LLM_MODEL_NAME", "gemini-2.0-flash-exp")
-else:
-    GEMINI_API_KEY = ""
-    LLM_MODEL_NAME = "gemini-2.0-flash-exp"
-
-# Import LLMClient from agentic_pipeline
-MISINFO_DIR_STR = str(MISINFO_DIR)
-if MISINFO_DIR_STR not in sys.path:
-    sys.path.insert(0, MISINFO_DIR_STR)
+from chatbot.tools._config import GEMINI_API_KEY, LLM_MODEL_NAME
 
 from agentic_pipeline import LLMClient  # type: ignore
 
 logger = get_logger(__name__)
 
+_PROMPT_TEMPLATE = """You are a helpful, factual AI assistant.
+
+Conversation History:
+{history_section}
+
+External Context:
+{external_section}
+
+User Message: {query}
+
+Instructions:
+- If the conversation history does not contain the needed facts, rely on accurate world knowledge instead of saying it wasn't discussed.
+- Clearly answer factual questions or provide summaries as requested.
+- When you rely on external or general knowledge, respond confidently and concisely.
+
+Assistant:"""
+
+_WS_RE = re.compile(r'\s+')
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.+?)\*')
+_H3_RE = re.compile(r'^### (.+?)$', re.MULTILINE)
+_H2_RE = re.compile(r'^## (.+?)$', re.MULTILINE)
+_H1_RE = re.compile(r'^# (.+?)$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_llm_client() -> LLMClient:
+    """Return the shared LLM client, creating it on first use rather than at import."""
+    return LLMClient(GEMINI_API_KEY, LLM_MODEL_NAME)
+
+
+# Keep the prompt (and Gemini latency/cost) bounded as conversations grow
+_HISTORY_CHAR_BUDGET = 4000
+
+
+# History is re-read from Mongo on every turn, so the same messages get stripped repeatedly
+@functools.lru_cache(maxsize=1024)
+def _extract_text_from_html(html_content: str) -> str:
+    """Extract plain text from HTML content."""
+    if not html_content:
+        return ""
+    # The parser drops tags and decodes entities in one pass
+    text = HTMLParser(html_content).text(separator=' ')
+    text = _WS_RE.sub(' ', text).strip()
+    return text
+
+
 class GeneralChatTool:
     """Tool for general conversation using Gemini."""
     
     def __init__(self):
-        self.llm_client = LLMClient(GEMINI_API_KEY, LLM_MODEL_NAME)
         self.name = "general_chat"
         self.description = "General conversation and Q&A using Gemini"
     
@@ -50,59 +81,37 @@ class GeneralChatTool:
     ) -> Dict[str, Any]:
         """Execute general chat."""
         try:
-            import re
-            from html import unescape
-            
-            def extract_text_from_html(html_content: str) -> str:
-                """Extract plain text from HTML content."""
-                if not html_content:
-                    return ""
-                # Remove HTML tags
-                text = re.sub(r'<[^>]+>', '', html_content)
-                # Decode HTML entities
-                text = unescape(text)
-                # Clean up whitespace
-                text = re.sub(r'\s+', ' ', text).strip()
-                return text
-            
-            # Build context from history
+            # Build context from history, newest first, until the character budget is spent
             context_parts = []
-            if conversation_history and len(conversation_history) > 0:
-                # Include all messages, not just last 5, for better context
-                for msg in conversation_history:
-                    role = msg.get('role', 'user')
-                    content = msg.get('content', '')
-                    
-                    # Extract plain text from HTML if needed
-                    if isinstance(content, str) and ('<' in content or '>' in content):
-                        content = extract_text_from_html(content)
-                    
-                    # Format role name
-                    role_name = "User" if role == "user" else "Assistant"
-                    context_parts.append(f"{role_name}: {content}")
+            used_chars = 0
+            for msg in reversed(conversation_history or []):
+                role = msg.get('role', 'user')
+                content = msg.get('content', '')
+                
+                # Extract plain text from HTML if needed
+                if isinstance(content, str) and '<' in content:
+                    content = _extract_text_from_html(content)
+                
+                # Format role name
+                role_name = "User" if role == "user" else "Assistant"
+                line = f"{role_name}: {content}"
+                if context_parts and used_chars + len(line) > _HISTORY_CHAR_BUDGET:
+                    break
+                context_parts.append(line)
+                used_chars += len(line) + 1
+            context_parts.reverse()
             
             history_section = "\n".join(context_parts) if context_parts else "No prior conversation history is available."
             external_section = external_context.strip() if external_context else "No supplemental external context is provided."
             
-            prompt = f"""You are a helpful, factual AI assistant.
-
-Conversation History:
-{history_section}
-
-External Context:
-{external_section}
-
-User Message: {query}
-
-Instructions:
-- If the conversation history does not contain the needed facts, rely on accurate world knowledge instead of saying it wasn't discussed.
-- Clearly answer factual questions or provide summaries as requested.
-- When you rely on external or general knowledge, respond confidently and concisely.
-
-Assistant:"""
+            prompt = _PROMPT_TEMPLATE.format(
+                history_section=history_section,
+                external_section=external_section,
+                query=query,
+            )
             
             # Generate response
-            response = await self.llm_client.model.generate_content_async(prompt)
+            response = await _get_llm_client().model.generate_content_async(prompt)
             response_text = response.text.strip()
             
             # Format as HTML (preserve markdown-like formatting)
@@ -127,18 +136,23 @@ Assistant:"""
     
     def _format_as_html(self, text: str) -> str:
         """Convert markdown-like text to HTML."""
-        import re
-        
-        # Convert **bold** to <strong>
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+        # Most replies are plain paragraphs; only run the passes whose marker is present
+        if '*' in text:
+            # Convert **bold** to <strong>
+            text = _BOLD_RE.sub(r'<strong>\1</strong>', text)
+            
+            # Convert *italic* to <em>
+            text = _ITALIC_RE.sub(r'<em>\1</em>', text)
         
-        # Convert *italic* to <em>
-        text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
+        if '#' in text:
+            # Convert # headings
+            text = _H3_RE.sub(r'<h3>\1</h3>', text)
+            text = _H2_RE.sub(r'<h2>\1</h2>', text)
+            text = _H1_RE.sub(r'<h1>\1</h1>', text)
         
-        # Convert # headings
-        text = re.sub(r'^### (.+?)$', r'<h3>\1</h3>', text, flags=re.MULTILINE)
-        text = re.sub(r'^## (.+?)$', r'<h2>\1</h2>', text, flags=re.MULTILINE)
-        text = re.sub(r'^# (.+?)$', r'<h1>\1</h1>', text, flags=re.MULTILINE)
+        # A single line that isn't a list item is one paragraph; skip the line walk
+        if '\n' not in text and not text.strip().startswith('- '):
+            return f'<p>{text}</p>'
         
         # Convert - lists to <ul>
         lines = text.split('\n')
@@ -8,41 +8,38 @@ BACKEND_ROOT = Path(__file__).resolve().parent.parent.parent
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
-MISINFO_DIR = BACKEND_ROOT / "misinformation-agent"
-if str(MISINFO_DIR) not in sys.path:
-    sys.path.insert(0, str(MISINFO_DIR))
-
 from logger import get_logger
-import importlib.util
-
-# Import from misinformation-agent config (MISINFO_DIR already defined above)
-misinfo_config_path = MISINFO_DIR / "config.py"
-spec = importlib.util.spec_from_file_location("misinfo_config", misinfo_config_path)
-if spec and spec.loader:
-    misinfo_config = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(misinfo_config)
-    GEMINI_API_KEY = misinfo_config.APP_CONFIG.get("GOOGLE_CLOUD_API_KEY", "")
-    LLM_MODEL_NAME = misinfo_config.APP_CONFIG.get("LLM_MODEL_NAME", "gemini-2.0-flash-exp")
-else:
-    GEMINI_API_KEY = ""
-    LLM_MODEL_NAME = "gemini-2.0-flash-exp"
-
-# Import LLMClient and run_pipeline from agentic_pipeline
-MISINFO_DIR_STR = str(MISINFO_DIR)
-if MISINFO_DIR_STR not in sys.path:
-    sys.path.insert(0, MISINFO_DIR_STR)
+import chatbot.tools._config  # noqa: F401  (puts misinformation-agent on sys.path)
 
-from agentic_pipeline import run_pipeline, LLMClient
+from agentic_pipeline import run_pipeline
 from models.claim import Claim
 from models.media import MediaItem
 
 logger = get_logger(__name__)
 
+_VERDICT_TEXT = {
+    "true": "verified as true",
+    "false": "likely false or contains misinformation",
+    "mixed": "mixed or unverified",
+    "unknown": "unable to verify",
+}
+
+_RESPONSE_TEMPLATE = """<p>I understand your question. After analyzing your claim through our comprehensive misinformation detection pipeline, here's what I found:</p>
+        
+        <h3>Analysis Result</h3>
+        <p>Based on the evidence gathered from multiple sources, the claim appears to be <strong>{verdict_text}</strong> with a confidence level of <strong>{confidence_pct:.1f}%</strong>.</p>
+        
+        <h3>Key Findings</h3>
+        <p>{summary}</p>
+        
+        {sources_line}"""
+
+_SOURCES_LINE_TEMPLATE = '<p><strong>Sources analyzed:</strong> {count} source{plural} were examined to reach this conclusion.</p>'
+
 class MisinformationTool:
     """Tool for misinformation detection pipeline."""
     
     def __init__(self):
-        self.llm_client = LLMClient(GEMINI_API_KEY, LLM_MODEL_NAME)
         self.name = "misinformation_check"
         self.description = "Verifies claims and detects misinformation using multi-agent pipeline"
     
@@ -60,17 +57,13 @@ class MisinformationTool:
             media_items = []
             if media:
                 for m in media:
-                    # MediaItem expects: type, data_base64, mime_type, filename
-                    # Convert bytes to base64 if needed
-                    import base64
-                    data_base64 = None
-                    if isinstance(m.get("data"), bytes):
-                        data_base64 = base64.b64encode(m.get("data")).decode('utf-8')
-                    elif isinstance(m.get("data"), str):
-                        data_base64 = m.get("data")
+                    # Raw bytes are handed over as-is; only string payloads are base64
+                    data_bytes = m.get("data") if isinstance(m.get("data"), bytes) else None
+                    data_base64 = m.get("data") if isinstance(m.get("data"), str) else None
                     
                     media_items.append(MediaItem(
                         type="image" if m.get("type", "").startswith("image") else "document",
+                        data_bytes=data_bytes,
                         data_base64=data_base64,
                         mime_type=m.get("type", "application/octet-stream"),
                         filename=m.get("filename", "upload"),
@@ -138,26 +131,18 @@ class MisinformationTool:
     
     def _format_response(self, verdict: str, confidence: float, summary: str, sources: List[Dict]) -> str:
         """Format response as natural, conversational HTML."""
-        verdict_text = {
-            "true": "verified as true",
-            "false": "likely false or contains misinformation",
-            "mixed": "mixed or unverified",
-            "unknown": "unable to verify",
-        }.get(verdict.lower(), "unable to verify")
-        
-        confidence_pct = confidence * 100
+        verdict_text = _VERDICT_TEXT.get(verdict.lower(), "unable to verify")
+        sources_line = (
+            _SOURCES_LINE_TEMPLATE.format(count=len(sources), plural="s" if len(sources) != 1 else "")
+            if sources
+            else ""
+        )
         
         # Create a natural, conversational response
-        html = f"""
-        <p>I understand your question. After analyzing your claim through our comprehensive misinformation detection pipeline, here's what I found:</p>
-        
-        <h3>Analysis Result</h3>
-        <p>Based on the evidence gathered from multiple sources, the claim appears to be <strong>{verdict_text}</strong> with a confidence level of <strong>{confidence_pct:.1f}%</strong>.</p>
-        
-        <h3>Key Findings</h3>
-        <p>{summary}</p>
-        
-        {f'<p><strong>Sources analyzed:</strong> {len(sources)} source{"s" if len(sources) != 1 else ""} were examined to reach this conclusion.</p>' if sources else ''}
-        """
-        return html.strip()
+        return _RESPONSE_TEMPLATE.format(
+            verdict_text=verdict_text,
+            confidence_pct=confidence * 100,
+            summary=summary,
+            sources_line=sources_line,
+        ).rstrip()
 
@@ -1,30 +1,14 @@
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # Add backend root to path
 BACKEND_ROOT = Path(__file__).resolve().parent.parent.parent
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
-MISINFO_DIR = BACKEND_ROOT / "misinformation-agent"
-if str(MISINFO_DIR) not in sys.path:
-    sys.path.insert(0, str(MISINFO_DIR))
-
 from logger import get_logger
-import importlib.util
-
-# Import from misinformation-agent config
-misinfo_config_path = MISINFO_DIR / "config.py"
-spec = importlib.util.spec_from_file_location("misinfo_config", misinfo_config_path)
-if spec and spec.loader:
-    misinfo_config = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(misinfo_config)
-    SERPAPI_API_KEY = misinfo_config.APP_CONFIG.get("SERPAPI_API_KEY", "")
-    FIRECRAWL_API_KEY = misinfo_config.APP_CONFIG.get("FIRECRAWL_API_KEY", "")
-else:
-    SERPAPI_API_KEY = ""
-    FIRECRAWL_API_KEY = ""
+from chatbot.tools._config import FIRECRAWL_API_KEY, SERPAPI_API_KEY
 
 # Import agents from misinformation-agent
 from agents.data_collection.web_search_agent import run as web_search
@@ -33,6 +17,20 @@ from models.claim import Claim
 
 logger = get_logger(__name__)
 
+_NEWS_HEADER_TEMPLATE = """<div>
+            <h3 style="margin-bottom: 12px;">Latest News on: {query}</h3>
+            <p style="margin-bottom: 12px;">Found {count} articles:</p>
+            <ul style="margin-left: 20px;">"""
+_NEWS_ITEM_TEMPLATE = """
+                <li style="margin-bottom: 8px;">
+                    <strong>{title}</strong>
+                    <br/>
+                    <span style="color: #666; font-size: 0.9em;">{snippet}...</span>
+                </li>"""
+_NEWS_FOOTER = """
+            </ul>
+        </div>"""
+
 class NewsSearchTool:
     """Tool for searching and fetching news."""
     
@@ -61,45 +59,24 @@ class NewsSearchTool:
             if progress_callback:
                 await progress_callback(f"Found {len(search_urls)} results, fetching content...")
             
-            # Scrape top results
+            urls = [url for url in search_urls[:max_results] if url]
+            
+            # One batched call; the scraper fans the URLs out, logs failures and drops them itself
+            scraped = await scrape_url(urls, FIRECRAWL_API_KEY)
+            by_url = {self._item_url(item): item for item in scraped}
+            scrape_results = [
+                self._build_entries(by_url[url], url, idx) if url in by_url else self._unscraped_entry(url, idx)
+                for idx, url in enumerate(urls)
+            ]
+            
+            # Merge in rank order
             sources = []
             articles = []
-            
-            for idx, url in enumerate(search_urls[:max_results]):
-                if url:
-                    try:
-                        # Scrape URL
-                        scraped = await scrape_url([url], FIRECRAWL_API_KEY)
-                        
-                        if scraped:
-                            item = scraped[0]
-                            content = item.content if hasattr(item, 'content') else item.get("content", "")
-                            meta = item.meta if hasattr(item, 'meta') else item.get("meta", {})
-                            title = meta.source_name if hasattr(meta, 'source_name') else meta.get("source_name", url)
-                            
-                            articles.append({
-                                "title": title,
-                                "url": url,
-                                "content": content,
-                            })
-                            
-                            sources.append({
-                                "title": title,
-                                "url": url,
-                                "snippet": content[:200] + "..." if len(content) > 200 else content,
-                                "relevance": 0.9 - (idx * 0.1),
-                                "agent": "news_search",
-                            })
-                    except Exception as e:
-                        logger.error(f"Error scraping {url}: {e}")
-                        # Still add URL even if scraping fails
-                        sources.append({
-                            "title": url,
-                            "url": url,
-                            "snippet": "",
-                            "relevance": 0.8 - (idx * 0.1),
-                            "agent": "news_search",
-                        })
+            for article, source in scrape_results:
+                if article:
+                    articles.append(article)
+                if source:
+                    sources.append(source)
             
             # Format response
             response_html = self._format_response(query, articles)
@@ -124,27 +101,50 @@ class NewsSearchTool:
                 "metadata": {},
             }
     
+    @staticmethod
+    def _unscraped_entry(url: str, idx: int) -> Tuple[None, Dict[str, Any]]:
+        """Keep a citation for a result whose content couldn't be scraped."""
+        return None, {
+            "title": url,
+            "url": url,
+            "snippet": "",
+            "relevance": 0.8 - (idx * 0.1),
+            "agent": "news_search",
+        }
+    
+    @staticmethod
+    def _item_url(item: Any) -> str:
+        meta = item.meta if hasattr(item, 'meta') else item.get("meta", {})
+        return meta.url if hasattr(meta, 'url') else meta.get("url", "")
+    
+    @staticmethod
+    def _build_entries(item: Any, url: str, idx: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Turn a scraped item into its (article, source) pair."""
+        content = item.content if hasattr(item, 'content') else item.get("content", "")
+        meta = item.meta if hasattr(item, 'meta') else item.get("meta", {})
+        title = meta.source_name if hasattr(meta, 'source_name') else meta.get("source_name", url)
+        
+        article = {
+            "title": title,
+            "url": url,
+            "content": content,
+        }
+        source = {
+            "title": title,
+            "url": url,
+            "snippet": content[:200] + "..." if len(content) > 200 else content,
+            "relevance": 0.9 - (idx * 0.1),
+            "agent": "news_search",
+        }
+        return article, source
+    
     def _format_response(self, query: str, articles: List[Dict]) -> str:
         """Format response as HTML."""
-        html = f"""
-        <div>
-            <h3 style="margin-bottom: 12px;">Latest News on: {query}</h3>
-            <p style="margin-bottom: 12px;">Found {len(articles)} articles:</p>
-            <ul style="margin-left: 20px;">
-        """
-        
-        for idx, article in enumerate(articles):
-            html += f"""
-                <li style="margin-bottom: 8px;">
-                    <strong>{article['title']}</strong>
-                    <br/>
-                    <span style="color: #666; font-size: 0.9em;">{article['content'][:150]}...</span>
-                </li>
-            """
-        
-        html += """
-            </ul>
-        </div>
-        """
-        return html.strip()
+        parts = [_NEWS_HEADER_TEMPLATE.format(query=query, count=len(articles))]
+        parts.extend(
+            _NEWS_ITEM_TEMPLATE.format(title=article['title'], snippet=article['content'][:150])
+            for article in articles
+        )
+        parts.append(_NEWS_FOOTER)
+        return "".join(parts)
 
@@ -49,6 +49,9 @@ else:
     TELEGRAM_SESSION_PATH = os.getenv("TELEGRAM_SESSION_PATH", os.path.join(_BACKEND_DIR, "telegram.session"))
 TELEGRAM_CHANNELS = os.getenv("TELEGRAM_CHANNELS")
 
+# Deepfake pipeline
+DEEPFAKE_MODEL_ENABLED = os.getenv("DEEPFAKE_MODEL_ENABLED", "").lower() in ("1", "true", "yes")
+
 
 # Validation
 if not MONGO_URI or not SECRET_KEY:
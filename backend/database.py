@@ -21,4 +21,27 @@ async def get_next_sequence(name: str) -> int:
         projection={"seq": 1, "_id": 0},
     )
     logger.debug(f"Generated next sequence for '{name}': {doc['seq']}")
-    return doc["seq"]
\ No newline at end of file
+    return doc["seq"]
+
+
+async def ensure_indexes() -> None:
+    """Create indexes and run one-shot data normalizations needed by hot queries."""
+    # Older detections stored numeric userIds; normalize them to strings so the
+    # stats lookup is a single indexed equality match.
+    migrated = await db.ai_detections.update_many(
+        {"userId": {"$type": "number"}},
+        [{"$set": {"userId": {"$toString": "$userId"}}}],
+    )
+    if migrated.modified_count:
+        logger.info(f"Normalized userId to string on {migrated.modified_count} ai_detections")
+    await db.ai_detections.create_index([("userId", 1), ("createdAt", -1)])
+    await db.users.create_index("email", unique=True)
+    await db.conversations.create_index("conversationId")
+    await db.deepfake_detections.create_index([("userId", 1), ("created_at", -1)])
+    await db.geocode_cache.create_index("createdAt", expireAfterSeconds=86400)
+    # Conversations created before messageCount existed get it derived once
+    await db.conversations.update_many(
+        {"messageCount": {"$exists": False}},
+        [{"$set": {"messageCount": {"$size": {"$ifNull": ["$messages", []]}}}}],
+    )
+    logger.info("Database indexes ensured")
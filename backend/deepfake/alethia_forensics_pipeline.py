@@ -1,18 +1,28 @@
 import os
 import logging
+import threading
 import cv2
 import torch
 import numpy as np
 from typing import Optional, Tuple, List
-from PIL import Image
-from io import BytesIO
 import base64
+try:
+    import av
+except ImportError:
+    av = None
 from .model.config import load_config
 from .model.pred_func import load_genconvit
 
 DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+MODEL_INPUT_SIZE = 224
+_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 80, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+if DEVICE.type == "cuda":
+    # Inputs are always 224x224, so cuDNN's algorithm search pays off after the first batch
+    torch.backends.cudnn.benchmark = True
+    torch.set_float32_matmul_precision("high")
 GENCON_MODEL = None
 MODEL_LOADED = False
+_MODEL_LOCK = threading.Lock()
 MODEL_ERROR = None
 
 def check_weights_available():
@@ -30,18 +40,56 @@ def check_weights_available():
         return False, f"VAE weight file not found: {vae_path}"
     return True, None
 
+def _compile_submodules(model) -> None:
+    """Wrap the ED and VAE backbones with torch.compile."""
+    for name in ("model_ed", "model_vae"):
+        submodule = getattr(model, name, None)
+        if submodule is not None:
+            # reduce-overhead captures CUDA graphs, which suits the small 30-frame batches
+            setattr(model, name, torch.compile(submodule, mode="reduce-overhead", fullgraph=False))
+
+def _warmup(model) -> None:
+    """Run one dummy batch so compilation and cuDNN autotuning happen before real traffic."""
+    run_inference(model, torch.zeros(30, 3, MODEL_INPUT_SIZE, MODEL_INPUT_SIZE, device=DEVICE))
+    torch.cuda.synchronize()
+
+def _compile_and_warm_up(model) -> None:
+    """Compile and warm up the model on CUDA hosts, falling back to eager mode on failure."""
+    # On CPU there is no compilation or autotuning to front-load; the warmup would only delay startup
+    if DEVICE.type != "cuda" or not hasattr(torch, "compile"):
+        return
+    eager = {name: getattr(model, name, None) for name in ("model_ed", "model_vae")}
+    try:
+        _compile_submodules(model)
+        _warmup(model)
+    except Exception as e:
+        logging.warning(f"torch.compile/warmup failed, serving the eager GenConViT model: {e}")
+        for name, submodule in eager.items():
+            if submodule is not None:
+                setattr(model, name, submodule)
+
 def get_local_model():
     """Get the local model, or None if weights are not available"""
+    # The load is attempted once per process; afterwards the outcome is just returned,
+    # without re-statting the weight files
+    if MODEL_LOADED:
+        return GENCON_MODEL
+    # Serialize the first load so concurrent requests can't each build the model
+    with _MODEL_LOCK:
+        if MODEL_LOADED:
+            return GENCON_MODEL
+        return _load_local_model()
+
+def _load_local_model():
     global GENCON_MODEL, MODEL_LOADED, MODEL_ERROR
     
     # Check if weights are available first
     weights_available, error_msg = check_weights_available()
     if not weights_available:
-        if not MODEL_LOADED:  # Only log once
-            logging.warning(f"Deepfake model weights not available: {error_msg}")
-            logging.warning("Deepfake detection will be disabled. Add weights folder to enable.")
-            MODEL_ERROR = error_msg
-            MODEL_LOADED = True
+        logging.warning(f"Deepfake model weights not available: {error_msg}")
+        logging.warning("Deepfake detection will be disabled. Add weights folder to enable.")
+        MODEL_ERROR = error_msg
+        MODEL_LOADED = True
         return None
     
     if GENCON_MODEL is None:
@@ -54,9 +102,6 @@ def get_local_model():
             GENCON_MODEL = load_genconvit(config, None, ed_weight, vae_weight, fp16=False)
             GENCON_MODEL.to(DEVICE)
             GENCON_MODEL.eval()
-            logging.info("GenConViT model loaded successfully (ED + VAE hybrid).")
-            MODEL_LOADED = True
-            MODEL_ERROR = None
         except FileNotFoundError as e:
             logging.error(f"Failed to load GenConViT weights: {e}")
             MODEL_ERROR = str(e)
@@ -77,9 +122,16 @@ def get_local_model():
                     logging.error(f"Failed to finalize model after partial load: {e2}")
             else:
                 logging.error(f"Failed to create GenConViT model: {e}")
+            # Don't let the cached fast path hand out a half-initialized model
+            GENCON_MODEL = None
             MODEL_ERROR = str(e)
             MODEL_LOADED = True
             return None
+        # Kept out of the load try: an optimization failure is not a weight problem
+        _compile_and_warm_up(GENCON_MODEL)
+        logging.info("GenConViT model loaded successfully (ED + VAE hybrid).")
+        MODEL_LOADED = True
+        MODEL_ERROR = None
     return GENCON_MODEL
 
 def is_model_available():
@@ -87,7 +139,48 @@ def is_model_available():
     model = get_local_model()
     return model is not None
 
+def run_inference(model, batch: torch.Tensor) -> torch.Tensor:
+    """Forward a preprocessed batch without autograd tracking, in FP16 on CUDA."""
+    with torch.inference_mode(), torch.autocast(
+        device_type="cuda", dtype=torch.float16, enabled=DEVICE.type == "cuda"
+    ):
+        return model(batch)
+
+def _sample_indices(total_frames: int, num_frames: int) -> np.ndarray:
+    if total_frames < num_frames:
+        return np.arange(total_frames).astype(int)
+    return np.linspace(0, total_frames - 1, num_frames, dtype=int)
+
+def _extract_frames_av(video_path: str, num_frames: int) -> Optional[List[np.ndarray]]:
+    """Decode sampled frames with PyAV, straight to RGB. None means fall back to OpenCV."""
+    frames = []
+    with av.open(video_path) as container:
+        stream = container.streams.video[0]
+        total_frames = stream.frames
+        if total_frames < 1:
+            # Frame count isn't in the container header; let OpenCV estimate it
+            return None
+        stream.thread_type = "AUTO"
+        wanted = iter(_sample_indices(total_frames, num_frames))
+        next_idx = next(wanted, None)
+        for frame_idx, frame in enumerate(container.decode(stream)):
+            if next_idx is None:
+                break
+            if frame_idx == next_idx:
+                frames.append(frame.to_ndarray(format="rgb24"))
+                next_idx = next(wanted, None)
+    return frames
+
 def extract_frames(video_path: str, num_frames: int = 30) -> List[np.ndarray]:
+    """Return sampled frames as RGB uint8 arrays."""
+    if av is not None:
+        try:
+            frames = _extract_frames_av(video_path, num_frames)
+            if frames is not None:
+                return frames
+        except (av.FFmpegError, IndexError) as e:
+            logging.warning(f"PyAV could not decode video, falling back to OpenCV: {e}")
+
     frames = []
     cap = cv2.VideoCapture(video_path)
     if not cap.isOpened():
@@ -97,25 +190,32 @@ def extract_frames(video_path: str, num_frames: int = 30) -> List[np.ndarray]:
     if total_frames < 1:
         logging.error("Error: Video file has no frames.")
         return []
-    if total_frames < num_frames:
-        indices = np.arange(total_frames).astype(int)
-    else:
-        indices = np.linspace(0, total_frames - 1, num_frames, dtype=int)
-    for i in indices:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, i)
-        ret, frame = cap.read()
-        if ret:
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            frames.append(frame_rgb)
+    # Decode linearly and only retrieve the sampled frames; seeking per index would
+    # force the decoder back to the previous keyframe every time
+    wanted = iter(_sample_indices(total_frames, num_frames))
+    next_idx = next(wanted, None)
+    frame_idx = 0
+    while next_idx is not None:
+        if not cap.grab():
+            break
+        if frame_idx == next_idx:
+            ret, frame = cap.retrieve()
+            if ret:
+                # Convert in place; the retrieved buffer isn't reused, so no second copy is needed
+                frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame))
+            next_idx = next(wanted, None)
+        frame_idx += 1
     cap.release()
     return frames
 
 def convert_frame_to_base64(frame: np.ndarray) -> str:
     try:
-        pil_img = Image.fromarray(frame)
-        buffer = BytesIO()
-        pil_img.save(buffer, format="JPEG")
-        img_str = base64.b64encode(buffer.getvalue()).decode("utf-8")
+        # Frames are RGB; imencode expects BGR
+        bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        ok, buf = cv2.imencode(".jpg", bgr, _JPEG_PARAMS)
+        if not ok:
+            raise ValueError("JPEG encoding failed")
+        img_str = base64.b64encode(buf).decode("ascii")
         return f"data:image/jpeg;base64,{img_str}"
     except Exception as e:
         logging.error(f"Failed to convert frame to Base64: {e}")
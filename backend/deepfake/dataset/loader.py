@@ -1,3 +1,4 @@
+import functools
 import os
 import torch
 from torchvision import transforms, datasets
@@ -60,9 +61,15 @@ class Aug(object):
         return Image.fromarray(augment(aug, np.array(img)))
 
 
+# ImageNet statistics the GenConViT backbones were trained with
+NORM_MEAN = [0.485, 0.456, 0.406]
+NORM_STD = [0.229, 0.224, 0.225]
+
+
+@functools.lru_cache(maxsize=1)
 def normalize_data():
-    mean = [0.485, 0.456, 0.406]
-    std = [0.229, 0.224, 0.225]
+    mean = NORM_MEAN
+    std = NORM_STD
 
     return {
         "train": transforms.Compose(
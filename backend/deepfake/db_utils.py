@@ -1,7 +1,5 @@
 # This file will handle MongoDB integration for deepfake results.
-from motor.motor_asyncio import AsyncIOMotorClient
 from typing import Dict, Any
-from config import MONGO_URI, MONGO_DB
 
 # Use shared database connection
 from database import db
@@ -8,12 +8,11 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Any
 from datetime import datetime
-import shutil
 import uuid
 
 # Import auth
 from auth.router import get_current_user
-from database import db, get_next_sequence
+from database import db
 
 # Deepfake model imports disabled - model too heavy for free deployment
 # from .model.config import load_config
@@ -28,6 +27,16 @@ def is_model_available():
 
 router = APIRouter()
 
+HISTORY_PROJECTION = {
+    "_id": 0,
+    "deepfakeId": 1,
+    "filename": 1,
+    "prediction": 1,
+    "confidence": 1,
+    "type": 1,
+    "created_at": 1,
+}
+
 class DeepfakeResult(BaseModel):
     deepfakeId: str
     filename: str
@@ -71,14 +80,13 @@ async def get_deepfake_history(
     """Get deepfake detection history for the current user"""
     user_id = current_user.get("user_id") or str(current_user["_id"])
     
+    # Only the summary fields the list view needs; served by the (userId, created_at) index
     cursor = db.deepfake_detections.find(
-        {"userId": user_id}
+        {"userId": user_id},
+        projection=HISTORY_PROJECTION,
     ).sort("created_at", -1).skip(skip).limit(limit)
     
-    results = []
-    async for doc in cursor:
-        doc["_id"] = str(doc["_id"])
-        results.append(doc)
+    results = await cursor.to_list(length=limit)
     
     return {"detections": results, "count": len(results)}
 
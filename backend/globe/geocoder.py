@@ -2,28 +2,92 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict
+from cachetools import TTLCache
+from geopy.adapters import AioHTTPAdapter
+from geopy.extra.rate_limiter import AsyncRateLimiter
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
-import time
 
+from database import db
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+_GEOCODE_TTL_SECONDS = 86400
+# 4 decimal places is a ~11 m grid, so nearby taps on the globe share one lookup
+_GEOCODE_PRECISION = 4
+_GEO_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=_GEOCODE_TTL_SECONDS)
+
 # Initialize geocoder with a user agent
-_geocoder = None
+_geocoder: Optional[Nominatim] = None
+_rate_limited_reverse: Optional[AsyncRateLimiter] = None
 
 
-def get_geocoder():
-    """Get or create the geocoder instance."""
-    global _geocoder
+def get_reverse_geocoder() -> AsyncRateLimiter:
+    """Get or create the async geocoder and return its rate-limited reverse lookup."""
+    global _geocoder, _rate_limited_reverse
     if _geocoder is None:
-        _geocoder = Nominatim(user_agent="globee-news-app/1.0")
-    return _geocoder
+        # The adapter opens its aiohttp session lazily, on the running loop, and reuses it
+        _geocoder = Nominatim(user_agent="globee-news-app/1.0", adapter_factory=AioHTTPAdapter)
+        # Nominatim's usage policy allows 1 request/s; waits without blocking the event loop
+        _rate_limited_reverse = AsyncRateLimiter(
+            _geocoder.reverse,
+            min_delay_seconds=1,
+            max_retries=0,
+            swallow_exceptions=False,
+        )
+    return _rate_limited_reverse
+
+
+async def close_geocoder() -> None:
+    """Close the geocoder's aiohttp session."""
+    global _geocoder, _rate_limited_reverse
+    if _geocoder is not None:
+        await _geocoder.__aexit__(None, None, None)
+        _geocoder = None
+        _rate_limited_reverse = None
+
+
+def _cache_key(latitude: float, longitude: float) -> str:
+    return f"{latitude:.{_GEOCODE_PRECISION}f},{longitude:.{_GEOCODE_PRECISION}f}"
+
+
+async def _get_cached_location(key: str) -> Optional[Dict[str, Optional[str]]]:
+    """Look a grid cell up in memory, then in the geocode_cache collection."""
+    cached = _GEO_CACHE.get(key)
+    if cached is not None:
+        return cached
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=_GEOCODE_TTL_SECONDS)
+    try:
+        # The TTL index only sweeps once a minute, so stale documents are filtered here too
+        doc = await db.geocode_cache.find_one(
+            {"_id": key, "createdAt": {"$gt": cutoff}},
+            projection={"result": 1, "_id": 0},
+        )
+    except Exception as e:
+        logger.warning(f"Geocode cache lookup failed: {e}")
+        return None
+    if doc is None:
+        return None
+    _GEO_CACHE[key] = doc["result"]
+    return doc["result"]
 
 
-def reverse_geocode(latitude: float, longitude: float) -> Dict[str, Optional[str]]:
+async def _cache_location(key: str, result: Dict[str, Optional[str]]) -> None:
+    _GEO_CACHE[key] = result
+    try:
+        await db.geocode_cache.replace_one(
+            {"_id": key},
+            {"result": result, "createdAt": datetime.now(timezone.utc)},
+            upsert=True,
+        )
+    except Exception as e:
+        logger.warning(f"Geocode cache write failed: {e}")
+
+
+async def reverse_geocode(latitude: float, longitude: float) -> Dict[str, Optional[str]]:
     """
     Reverse geocode lat/long to get city, state, and country information.
     
@@ -35,22 +99,26 @@ def reverse_geocode(latitude: float, longitude: float) -> Dict[str, Optional[str
         Dictionary with 'city', 'state', 'country', and 'country_code' keys.
         Values may be None if not found.
     """
-    geocoder = get_geocoder()
+    key = _cache_key(latitude, longitude)
+    cached = await _get_cached_location(key)
+    if cached is not None:
+        return cached
+    
+    reverse = get_reverse_geocoder()
     
     try:
-        # Add a small delay to respect rate limits
-        time.sleep(1)
-        
-        location = geocoder.reverse((latitude, longitude), exactly_one=True, timeout=10)
+        location = await reverse((latitude, longitude), exactly_one=True, timeout=10)
         
         if not location:
             logger.warning(f"No location found for coordinates: {latitude}, {longitude}")
-            return {
+            result = {
                 "city": None,
                 "state": None,
                 "country": None,
                 "country_code": None,
             }
+            await _cache_location(key, result)
+            return result
         
         address = location.raw.get("address", {})
         
@@ -88,6 +156,7 @@ def reverse_geocode(latitude: float, longitude: float) -> Dict[str, Optional[str
             f"Geocoded {latitude}, {longitude} -> City: {city}, State: {state}, Country: {country} ({country_code})"
         )
         
+        await _cache_location(key, result)
         return result
         
     except GeocoderTimedOut:
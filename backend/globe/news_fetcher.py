@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import List, Optional, Dict, Any
 import httpx
 from datetime import datetime
+from functools import lru_cache
+from cachetools import TTLCache
 
 from config import GNEWS_API_KEY, GNEWS_API_BASE_URL
 from logger import get_logger
@@ -12,9 +14,41 @@ from logger import get_logger
 logger = get_logger(__name__)
 
 GNEWS_BASE_URL = GNEWS_API_BASE_URL.rstrip("/")
+_SEARCH_URL = f"{GNEWS_BASE_URL}/search"
+# Query parameters shared by every search; per-call fields are appended to a copy
+_STATIC_PARAMS = (("apikey", GNEWS_API_KEY), ("lang", "en"))
 
+# Absorbs repeat polling from the globe view without spending GNews quota
+_NEWS_CACHE: TTLCache = TTLCache(maxsize=512, ttl=300)
 
-def fetch_news_by_location(
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the GNews client, created lazily on the running loop and reused across requests."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=60.0,
+            ),
+        )
+    return _CLIENT
+
+
+async def close_news_client() -> None:
+    """Close the GNews HTTP client (called on app shutdown)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+async def fetch_news_by_location(
     city: Optional[str] = None,
     state: Optional[str] = None,
     country_code: Optional[str] = None,
@@ -43,73 +77,80 @@ def fetch_news_by_location(
     if limit < 1:
         limit = 10
     
-    articles = []
+    key = (city, state, country_code, limit)
+    cached = _NEWS_CACHE.get(key)
+    if cached is not None:
+        return cached
     
-    # Priority 1: Try city with country filter for better relevance
+    articles = await _fetch_news_by_priority(city, state, country_code, limit)
+    if articles:
+        _NEWS_CACHE[key] = articles
+    return articles
+
+
+async def _fetch_news_by_priority(
+    city: Optional[str],
+    state: Optional[str],
+    country_code: Optional[str],
+    limit: int,
+) -> List[Dict[str, Any]]:
+    """Walk the city -> state -> country ladder, filling up from the most specific levels first."""
+    # (label, query, country) in priority order
+    candidates = []
     if city and country_code:
-        try:
-            logger.info(f"Fetching news for city: {city} in country: {country_code}")
-            articles = _fetch_news_gnews(query=city, country=country_code, limit=limit)
-            if articles and len(articles) >= limit:
-                logger.info(f"Found {len(articles)} articles for city {city}")
-                return articles[:limit]
-        except Exception as e:
-            logger.warning(f"Failed to fetch news for city {city}: {e}")
-    
-    # Priority 2: Try city alone (without country filter)
-    if city and not articles:
-        try:
-            logger.info(f"Fetching news for city: {city}")
-            articles = _fetch_news_gnews(query=city, limit=limit)
-            if articles and len(articles) >= limit:
-                logger.info(f"Found {len(articles)} articles for city {city}")
-                return articles[:limit]
-        except Exception as e:
-            logger.warning(f"Failed to fetch news for city {city}: {e}")
+        candidates.append((f"city {city} in country {country_code}", city, country_code))
+    if city:
+        candidates.append((f"city {city}", city, None))
+    if state and country_code:
+        candidates.append((f"state {state} in country {country_code}", state, country_code))
+    if state:
+        candidates.append((f"state {state}", state, None))
+    if country_code:
+        candidates.append((f"country {country_code}", None, country_code))
     
-    # Priority 3: Try state with country filter
-    if state and country_code and not articles:
-        try:
-            logger.info(f"Fetching news for state: {state} in country: {country_code}")
-            articles = _fetch_news_gnews(query=state, country=country_code, limit=limit)
-            if articles and len(articles) >= limit:
-                logger.info(f"Found {len(articles)} articles for state {state}")
-                return articles[:limit]
-        except Exception as e:
-            logger.warning(f"Failed to fetch news for state {state}: {e}")
+    # City-states and regions named after their city (e.g. Singapore) repeat a query
+    attempted = set()
+    levels = []
+    for label, query, country in candidates:
+        if (query, country) in attempted:
+            continue
+        attempted.add((query, country))
+        levels.append((label, query, country))
     
-    # Priority 4: Try state alone
-    if state and not articles:
+    articles: List[Dict[str, Any]] = []
+    seen_urls = set()
+    # One level at a time: a broader level is only queried when the narrower ones came back
+    # short, so the common case costs a single call against the GNews rate limit
+    for label, query, country in levels:
         try:
-            logger.info(f"Fetching news for state: {state}")
-            articles = _fetch_news_gnews(query=state, limit=limit)
-            if articles and len(articles) >= limit:
-                logger.info(f"Found {len(articles)} articles for state {state}")
-                return articles[:limit]
+            logger.info(f"Fetching news for {label}")
+            results = await _fetch_news_gnews(query=query, country=country, limit=limit)
         except Exception as e:
-            logger.warning(f"Failed to fetch news for state {state}: {e}")
+            logger.warning(f"Failed to fetch news for {label}: {e}")
+            continue
+        if not results:
+            continue
+        logger.info(f"Found {len(results)} articles for {label}")
+        # Broader levels often return the same stories; keep each URL once
+        for article in results:
+            url = article.get("url")
+            if url in seen_urls:
+                continue
+            if url:
+                seen_urls.add(url)
+            articles.append(article)
+        if len(articles) >= limit:
+            return articles[:limit]
     
-    # Priority 5: Fall back to country
-    if country_code and not articles:
-        try:
-            logger.info(f"Fetching news for country: {country_code}")
-            articles = _fetch_news_gnews(country=country_code, limit=limit)
-            if articles:
-                logger.info(f"Found {len(articles)} articles for country {country_code}")
-                return articles[:limit]
-        except Exception as e:
-            logger.warning(f"Failed to fetch news for country {country_code}: {e}")
-    
-    # If all else fails, return what we have or empty list
     if articles:
         logger.info(f"Returning {len(articles)} articles (less than requested {limit})")
-        return articles[:limit]
+        return articles
     
     logger.warning("No news found for any location level")
     return []
 
 
-def _fetch_news_gnews(
+async def _fetch_news_gnews(
     query: Optional[str] = None,
     country: Optional[str] = None,
     limit: int = 10,
@@ -126,33 +167,27 @@ def _fetch_news_gnews(
         List of raw article dictionaries from GNews
     """
     try:
-        url = f"{GNEWS_BASE_URL}/search"
-        params = {
-            "apikey": GNEWS_API_KEY,
-            "lang": "en",
-            "max": min(limit, 10),
-        }
+        params = [*_STATIC_PARAMS, ("max", min(limit, 10))]
         
         if query:
-            params["q"] = query
+            params.append(("q", query))
         
         if country:
-            params["country"] = country.lower()
+            params.append(("country", country.lower()))
         
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if not data or not data.get("articles"):
-                logger.warning("No articles found in GNews response")
-                return []
-            
-            results = data.get("articles", [])
-            logger.info(f"Fetched {len(results)} news articles from GNews")
-            
-            return results
+        response = await _get_client().get(_SEARCH_URL, params=params)
+        response.raise_for_status()
+        
+        data = response.json()
+        
+        if not data or not data.get("articles"):
+            logger.warning("No articles found in GNews response")
+            return []
+        
+        results = data.get("articles", [])
+        logger.info(f"Fetched {len(results)} news articles from GNews")
+        
+        return results
             
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error fetching news from GNews: {e.response.status_code} - {e.response.text}")
@@ -175,46 +210,66 @@ def format_news_article(article: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Formatted article dictionary compatible with the schema
     """
-    # Parse published date
-    published_at_str = article.get("publishedAt")
-    pub_date = None
-    if published_at_str:
-        try:
-            # GNews uses ISO format like "2024-01-15T10:30:00Z"
-            pub_date = published_at_str
-        except Exception:
-            pass
-    
     # Extract source information
     source_info = article.get("source", {})
     source_name = source_info.get("name", "Unknown Source") if isinstance(source_info, dict) else "Unknown Source"
     
+    # Nearby coordinates keep returning the same headlines, so the formatted fields are memoized
+    # on the article's hashable inputs. The cached dict holds only immutable values (tuples for
+    # the list fields), and every caller gets a new dict with fresh lists.
+    cached = _format_article_fields(
+        article.get("url"),
+        article.get("title"),
+        article.get("description"),
+        article.get("content"),
+        article.get("image"),
+        source_name,
+        article.get("publishedAt"),
+        article.get("language"),
+    )
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in cached.items()}
+
+
+@lru_cache(maxsize=10000)
+def _format_article_fields(
+    url: Optional[str],
+    title: Optional[str],
+    description: Optional[str],
+    content: Optional[str],
+    image: Optional[str],
+    source_name: str,
+    published_at: Optional[str],
+    language: Optional[str],
+) -> Dict[str, Any]:
+    # GNews uses ISO format like "2024-01-15T10:30:00Z", which the schema keeps as a string
+    pub_date = published_at or None
+    
     # Get description or use content as fallback
-    description = article.get("description") or article.get("content", "")[:500] or ""
+    description = description or (content or "")[:500] or ""
     
     return {
         "article_id": None,  # GNews doesn't provide article IDs
-        "title": article.get("title", "") or "No Title",
+        "title": title or "No Title",
         "description": description,
-        "content": article.get("content", "") or "",
-        "link": article.get("url", "") or "#",
-        "image_url": article.get("image"),
+        "content": content or "",
+        "link": url or "#",
+        "image_url": image,
         "video_url": None,  # GNews doesn't provide video URLs in search results
         "source_name": source_name,
         "source_url": None,  # GNews doesn't provide source URLs
         "source_icon": None,  # GNews doesn't provide source icons
         "pub_date": pub_date,
         "pub_date_tz": None,  # GNews doesn't provide timezone info separately
-        "language": article.get("language", "en") or "en",
-        "country": [],  # GNews doesn't provide country list per article
-        "category": [],  # GNews doesn't provide categories in search results
-        "keywords": [],  # GNews doesn't provide keywords
-        "creator": [],  # GNews doesn't provide creator information
+        "language": language or "en",
+        "country": (),  # GNews doesn't provide country list per article
+        "category": (),  # GNews doesn't provide categories in search results
+        "keywords": (),  # GNews doesn't provide keywords
+        "creator": (),  # GNews doesn't provide creator information
         "sentiment": None,  # GNews doesn't provide sentiment analysis
         "sentiment_stats": None,  # GNews doesn't provide sentiment stats
-        "ai_tag": [],  # GNews doesn't provide AI tags
-        "ai_region": [],  # GNews doesn't provide AI regions
-        "ai_org": [],  # GNews doesn't provide AI orgs
+        "ai_tag": (),  # GNews doesn't provide AI tags
+        "ai_region": (),  # GNews doesn't provide AI regions
+        "ai_org": (),  # GNews doesn't provide AI orgs
         "ai_summary": None,  # GNews doesn't provide AI summary
     }
 
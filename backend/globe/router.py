@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from typing import List, Optional
 
 from auth.router import get_current_user
 from globe.schema import LocationNewsRequest, LocationNewsResponse, LocationInfo, NewsArticle
@@ -13,7 +15,25 @@ from logger import get_logger
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/globe", tags=["globe"])
+router = APIRouter(prefix="/globe", tags=["globe"], default_response_class=ORJSONResponse)
+
+# Built once so the whole batch is validated in a single call into pydantic-core
+_ARTICLES_ADAPTER = TypeAdapter(List[NewsArticle])
+
+
+def _detect_search_priority(articles: List[NewsArticle], city: Optional[str], state: Optional[str]) -> str:
+    """Return the most specific location level mentioned in any article's title or description."""
+    city = city.lower() if city else None
+    state = state.lower() if state else None
+    search_priority = "country"  # Default fallback
+    for article in articles:
+        # Lowercase each article once and check both names against it in the same pass
+        text = f"{article.title}\n{article.description}".lower()
+        if city and city in text:
+            return "city"
+        if state and state in text:
+            search_priority = "state"
+    return search_priority
 
 
 @router.post("/news", response_model=LocationNewsResponse, status_code=status.HTTP_200_OK)
@@ -30,7 +50,7 @@ async def get_location_news(
         logger.info(f"Fetching news for location: {request.latitude}, {request.longitude}")
         
         # Step 1: Reverse geocode to get location information
-        location_data = reverse_geocode(request.latitude, request.longitude)
+        location_data = await reverse_geocode(request.latitude, request.longitude)
         if not location_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -39,7 +59,7 @@ async def get_location_news(
         location_info = LocationInfo(**location_data)
         
         # Step 2: Fetch news with priority: city -> state -> country
-        articles_raw = fetch_news_by_location(
+        articles_raw = await fetch_news_by_location(
             city=location_info.city,
             state=location_info.state,
             country_code=location_info.country_code,
@@ -47,22 +67,10 @@ async def get_location_news(
         )
         
         # Step 3: Format articles
-        articles = [NewsArticle(**format_news_article(article)) for article in articles_raw]
+        articles = _ARTICLES_ADAPTER.validate_python([format_news_article(article) for article in articles_raw])
         
         # Determine which location level was used
-        search_priority = "country"  # Default fallback
-        if location_info.city and any(
-            location_info.city.lower() in article.title.lower() 
-            or location_info.city.lower() in article.description.lower()
-            for article in articles
-        ):
-            search_priority = "city"
-        elif location_info.state and any(
-            location_info.state.lower() in article.title.lower() 
-            or location_info.state.lower() in article.description.lower()
-            for article in articles
-        ):
-            search_priority = "state"
+        search_priority = _detect_search_priority(articles, location_info.city, location_info.state)
         
         logger.info(
             f"Returning {len(articles)} articles for location "
@@ -1,4 +1,6 @@
+import asyncio
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -6,6 +8,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from logger import get_logger
 from auth.router import router as auth_router
+from database import ensure_indexes
+from config import DEEPFAKE_MODEL_ENABLED
 # from dashboard.router import router as dashboard_router (Future)
 
 MISINFO_DIR = Path(__file__).resolve().parent / "misinformation-agent"
@@ -19,23 +23,54 @@ from globe.router import router as globe_router  # type: ignore  # noqa: E402
 from social_graph.router import router as social_graph_router  # type: ignore  # noqa: E402
 from tts.router import router as tts_router  # type: ignore  # noqa: E402
 from ai_detection.router import router as ai_detection_router  # type: ignore  # noqa: E402
-from chatbot.router import router as chatbot_router  # type: ignore  # noqa: E402
+from ai_detection.service import close_sightengine_client  # type: ignore  # noqa: E402
+from chatbot.router import router as chatbot_router, close_assembly_client  # type: ignore  # noqa: E402
+from chatbot.tools._http import close_http_client  # type: ignore  # noqa: E402
+from globe.geocoder import close_geocoder  # type: ignore  # noqa: E402
+from globe.news_fetcher import close_news_client  # type: ignore  # noqa: E402
 from deepfake.router import router as deepfake_router  # type: ignore  # noqa: E402
 
 logger = get_logger(__name__)
 
+# Default executor size for asyncio.to_thread / run_in_executor offloads (bcrypt, search SDKs)
+_THREAD_POOL_SIZE = 64
+
+
+async def warmup_deepfake_model():
+    """Load the deepfake model (compiled and warmed up on CUDA) before the first request arrives."""
+    try:
+        from deepfake.alethia_forensics_pipeline import get_local_model  # type: ignore
+    except ImportError as e:
+        logger.warning(f"Deepfake model warmup skipped: {e}")
+        return
+    # Loading, CUDA context init and cuDNN autotuning block for seconds; keep them off the loop
+    model = await asyncio.to_thread(get_local_model)
+    if model is None:
+        logger.warning("Deepfake model warmup skipped: model unavailable")
+    else:
+        logger.info("Deepfake model warmed up")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown events."""
     # Startup
     logger.info("Starting application...")
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=_THREAD_POOL_SIZE))
+    await ensure_indexes()
     setup_scheduler()
+    if DEEPFAKE_MODEL_ENABLED:
+        await warmup_deepfake_model()
     logger.info("Application started successfully")
     yield
     # Shutdown
     logger.info("Shutting down application...")
     shutdown_scheduler()
+    await close_sightengine_client()
+    await close_assembly_client()
+    await close_http_client()
+    await close_geocoder()
+    await close_news_client()
     logger.info("Application shut down")
 
 
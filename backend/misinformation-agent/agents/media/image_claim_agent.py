@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-import base64
+import asyncio
 import json
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
+try:
+    # SIMD-accelerated drop-in for the stdlib codec
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
 from models.claim import Claim
 from models.media import MediaItem
 from models.collected_data import CollectedDataItem, SourceMetaData
@@ -69,9 +75,14 @@ def _strip_base64_header(data: str) -> str:
 
 
 async def _load_image_bytes(media: MediaItem) -> Tuple[bytes, str]:
+    if media.data_bytes:
+        return media.data_bytes, media.mime_type or "image/png"
+
     if media.data_base64:
         try:
-            return base64.b64decode(_strip_base64_header(media.data_base64)), media.mime_type or "image/png"
+            # Multi-MB payloads take long enough to decode that they'd stall the event loop
+            data = await asyncio.to_thread(b64decode, _strip_base64_header(media.data_base64))
+            return data, media.mime_type or "image/png"
         except Exception as exc:
             raise ValueError(f"Invalid base64 payload for media {media.filename or 'image'}: {exc}") from exc
 
@@ -21,6 +21,12 @@ class MediaItem(BaseModel):
         default=None,
         description="Base64-encoded payload for the media (used for direct uploads).",
     )
+    data_bytes: Optional[bytes] = Field(
+        default=None,
+        exclude=True,
+        repr=False,
+        description="Raw payload for in-process callers; avoids a base64 round-trip.",
+    )
     mime_type: Optional[str] = Field(
         default=None, description="MIME type of the attachment (e.g., image/png)."
     )
@@ -39,6 +39,10 @@ def parse_channel_list(value: str | None) -> List[str]:
     return [channel for channel in channels if channel]
 
 
+# Parsed once at import so callers don't re-split the env string on every use
+_CONFIGURED_CHANNELS = tuple(parse_channel_list(TELEGRAM_CHANNELS))
+
+
 class TelegramClientManager:
     """Async context manager that yields an authorized Telegram client."""
 
@@ -81,7 +85,7 @@ class TelegramClientManager:
 
 def get_configured_channel_list() -> List[str]:
     """Return the configured Telegram channels."""
-    return parse_channel_list(TELEGRAM_CHANNELS)
+    return list(_CONFIGURED_CHANNELS)
 
 
 def build_channel_priority_map(channels: List[str]) -> dict[str, int]: